@@ -4,6 +4,7 @@ import json
 import pytest_asyncio
 import asyncio
 import requests
+import uuid
 
 base_url = "http://localhost:8000"
 base_uri = "ws://localhost:8000/ws"
@@ -123,6 +124,83 @@ async def test_unsubscribe():
             pytest.fail(f"❌ Failed unsubscription test: {e}")
 
 
+@pytest.mark.asyncio
+async def test_subscribe_order():
+    """
+    Test that subscribing to the status updates of a TWAP order requires the token of its owner.
+    """
+    order_id = "550e8400-e29b-41d4-a716-446655440000"
+
+    async with websockets.connect(base_uri) as websocket:
+        try:
+            # Drain the welcome message
+            message = await websocket.recv()
+            data = json.loads(message)
+            assert data.get("type") == "welcome", f"❌ Expected 'type' to be 'welcome', got {data}"
+
+            # Subscribe to the order status updates without a token
+            await websocket.send(json.dumps({"action": "subscribe_order", "order_id": order_id}))
+
+            # Wait for subscription refusal
+            message = await websocket.recv()
+            data = json.loads(message)
+            assert data.get("type") == "subscribe_order_failure", \
+                f"❌ Expected 'type' to be 'subscribe_order_failure', got {data}"
+            assert data.get("order_id") == order_id, f"❌ Expected order_id {order_id}, got {data}"
+
+        except Exception as e:
+            pytest.fail(f"❌ Failed order subscription test: {e}")
+
+
+@pytest.mark.asyncio
+async def test_order_status_update():
+    """
+    Test that the status updates of a submitted TWAP order are pushed to its subscribers.
+    """
+    response = requests.post(
+        f"{base_url}/register",
+        json={"username": f"user_{uuid.uuid4().hex}", "password": "new_password"}
+    )
+    assert response.status_code == 201, f"Expected 201, got {response.status_code}"
+    token = response.json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    try:
+        # Submit a TWAP order
+        order = {
+            "symbol": "BTCUSDT",
+            "side": "buy",
+            "total_quantity": 0.1,
+            "limit_price": 100000,
+            "duration_seconds": 2,
+            "exchanges": ["Binance"]
+        }
+        response = requests.post(f"{base_url}/orders/twap", json=order, headers=headers)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        order_id = response.json()["token_id"]
+
+        async with websockets.connect(base_uri) as websocket:
+            # Drain the welcome message
+            await websocket.recv()
+
+            # Subscribe to the order status updates: the current state is sent back
+            await websocket.send(json.dumps({"action": "subscribe_order", "order_id": order_id, "token": token}))
+            data = json.loads(await websocket.recv())
+            assert data.get("type") == "subscribe_order_success", \
+                f"❌ Expected 'type' to be 'subscribe_order_success', got {data}"
+            assert data["order_status"]["order_id"] == order_id, f"❌ Expected order_id {order_id}, got {data}"
+
+            # Wait for the first status update pushed while the order executes
+            data = json.loads(await asyncio.wait_for(websocket.recv(), timeout=30.0))
+            assert data.get("type") == "order_status_update", \
+                f"❌ Expected 'type' to be 'order_status_update', got {data}"
+            assert data["order_status"]["order_id"] == order_id, f"❌ Expected order_id {order_id}, got {data}"
+
+    finally:
+        # Remove the test user
+        requests.delete(f"{base_url}/unregister", headers=headers)
+
+
 def test_login():
     """
     Test logging in to the API. If login fails, it is considered a success.
@@ -168,6 +246,30 @@ def test_register():
         pytest.fail(f"Unexpected error: {response.status_code}")
 
 
+def test_register_token():
+    """
+    Test registering a new user and accessing a protected endpoint with the returned JWT token.
+    """
+    username = f"user_{uuid.uuid4().hex}"
+
+    response = requests.post(
+        f"{base_url}/register",
+        json={"username": username, "password": "new_password"}
+    )
+    assert response.status_code == 201, f"Expected 201, got {response.status_code}"
+
+    token = response.json().get("access_token")
+    assert token, "Token not received."
+    headers = {"Authorization": f"Bearer {token}"}
+
+    try:
+        response = requests.get(f"{base_url}/secure", headers=headers)
+        assert response.status_code == 200, f"Error accessing secure endpoint: {response.status_code}"
+    finally:
+        # Remove the test user
+        requests.delete(f"{base_url}/unregister", headers=headers)
+
+
 def test_get_secure_data():
     """
     Test accessing a protected endpoint using the JWT token.
@@ -1,10 +1,13 @@
 import asyncio
+import aiohttp
 import websockets
 import json
 import requests
-import time
 from typing import Dict, Any, Optional, Set
 
+# Time (in seconds) without order status update after which the order state is fetched again
+ORDER_STATUS_TIMEOUT = 5
+
 
 class APIClientDemo:
     """
@@ -157,26 +160,61 @@ class APIClientDemo:
         print("❌ Failed to place order:", response.text)
         return None
 
-    def track_order_status(self, token_id: str):
-        """Tracks a TWAP order execution."""
-        print("\nTracking TWAP order execution...")
+    async def fetch_order_status(self, token_id: str) -> Optional[Dict[str, Any]]:
+        """Fetches the current state of a TWAP order from the API (without blocking the event loop)."""
         headers = {"Authorization": f"Bearer {self.token}"}
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f"{self.base_url}/orders/", params={"order_id": token_id}, headers=headers,
+                                   timeout=aiohttp.ClientTimeout(total=5)) as response:
+                if response.status == 200:
+                    orders = await response.json()
+                    if orders:
+                        return orders[0]
+
+                print("❌ Failed to fetch order status:", await response.text())
+                return None
+
+    @staticmethod
+    def print_order_status(order_status: Dict[str, Any]) -> bool:
+        """Prints the state of a TWAP order and returns whether it is fully executed."""
+        percentage = order_status.get("percent_exec", 0)
+        print(f"Order Status: {order_status.get('status', 'Unknown')} - Executed: {percentage:.2f}%")
+
+        if order_status.get("status") == "completed":
+            print("✅ Order fully executed!")
+            return True
+        return False
 
-        while True:
-            response = requests.get(f"{self.base_url}/orders/?order_id={token_id}", headers=headers)
-            if response.status_code != 200:
-                print("❌ Failed to fetch order status:", response.text)
-                break
+    async def track_order_status(self, token_id: str):
+        """
+        Tracks a TWAP order execution with the status updates pushed over the WebSocket.
+        The server answers the subscription with the current state (the order may already be completed).
+        The state is fetched again whenever no update is received for ORDER_STATUS_TIMEOUT seconds.
+        """
+        print("\nTracking TWAP order execution...")
 
-            order_status = response.json()[0]
-            percentage = order_status.get("percent_exec", 0)
-            print(f"Order Status: {order_status.get('status', 'Unknown')} - Executed: {percentage:.2f}%")
+        async with websockets.connect(self.base_uri) as websocket:
+            await websocket.send(json.dumps({"action": "subscribe_order", "order_id": token_id,
+                                             "token": self.token}))
 
-            if order_status.get("status") == "completed":
-                print("✅ Order fully executed!")
-                break
+            while True:
+                try:
+                    message = await asyncio.wait_for(websocket.recv(), timeout=ORDER_STATUS_TIMEOUT)
+                except asyncio.TimeoutError:
+                    order_status = await self.fetch_order_status(token_id)
+                    if order_status is None or self.print_order_status(order_status):
+                        break
+                    continue
+
+                data = json.loads(message)
+                if "error" in data:
+                    print("❌ Failed to subscribe to the order:", data["error"])
+                    break
+                if data.get("type") not in ("subscribe_order_success", "order_status_update"):
+                    continue
 
-            time.sleep(1)
+                if self.print_order_status(data["order_status"]):
+                    break
 
     def get_all_orders(self):
         """Retrieves all TWAP orders from the API."""
@@ -235,7 +273,7 @@ async def main():
     }
     token_id = client.place_twap_order(order_params)
     if token_id:
-        client.track_order_status(token_id)
+        await client.track_order_status(token_id)
 
     # Get all orders
     client.get_all_orders()
@@ -66,12 +66,12 @@ def create_token(username: str) -> str:
     )
 
 
-async def verify_token(credentials : HTTPAuthorizationCredentials = Depends(security)):
+def get_token_username(token: str) -> str:
     """
-        Verify the validity of a JWT token.
+        Decode a JWT token and return its username.
 
         Args:
-            credentials (HTTPAuthorizationCredentials): The token extracted from the request header.
+            token (str): The JWT token.
 
         Returns:
             str: The username associated with the valid token.
@@ -79,7 +79,6 @@ async def verify_token(credentials : HTTPAuthorizationCredentials = Depends(secu
         Raises:
             HTTPException (401): If the token is expired, invalid, or any other authentication error occurs.
     """
-    token = credentials.credentials
     try:
         payload = PyJWT.decode(token, SECRET_KEY, algorithms=["HS256"])
         return payload["username"]
@@ -88,4 +87,20 @@ async def verify_token(credentials : HTTPAuthorizationCredentials = Depends(secu
     except PyJWT.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
     except Exception as e:
-        raise HTTPException(status_code=401, detail=f"Authentication error: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=401, detail=f"Authentication error: {str(e)}")
+
+
+async def verify_token(credentials : HTTPAuthorizationCredentials = Depends(security)):
+    """
+        Verify the validity of a JWT token.
+
+        Args:
+            credentials (HTTPAuthorizationCredentials): The token extracted from the request header.
+
+        Returns:
+            str: The username associated with the valid token.
+
+        Raises:
+            HTTPException (401): If the token is expired, invalid, or any other authentication error occurs.
+    """
+    return get_token_username(credentials.credentials)
\ No newline at end of file
@@ -1,13 +1,114 @@
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, Optional
 from datetime import datetime
+from functools import lru_cache
+import asyncio
+import time
+import aiohttp
 import pandas as pd
 
+
+@lru_cache(maxsize=2)
+def format_timestamp(second: int) -> str:
+    """
+    Format a Unix time (in whole seconds) as "%Y-%m-%d %H:%M:%S".
+    Memoized: the string only changes once per second.
+    """
+    return datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+
+# Time (in seconds) the trading pairs of an exchange are kept before being fetched again
+TRADING_PAIRS_TTL = 300
+
+# Timeout (in seconds) of the requests fetching the trading pairs
+TRADING_PAIRS_TIMEOUT = 10
+
 class ExchangeBase(ABC):
     """
     Abstract base class for defining exchange.
     """
 
+    # HTTP session shared by all the exchanges, and the event loop it is bound to
+    _http_session: Optional[aiohttp.ClientSession] = None
+    _http_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # Trading pairs, their symbols and when they were fetched (see cached_trading_pairs)
+    _trading_pairs: Optional[Dict[str, str]] = None
+    _symbols: Optional[frozenset] = None
+    _trading_pairs_time: float = 0.0
+
+    @staticmethod
+    def get_http_session() -> aiohttp.ClientSession:
+        """
+        Return the HTTP session shared by all the exchanges.
+
+        Reusing one session keeps its connection pool (DNS resolution, TLS handshakes)
+        between requests. A new session is created if there is none yet, if it was closed
+        or if it belongs to another event loop.
+
+        Returns:
+            aiohttp.ClientSession: The shared session.
+        """
+        loop = asyncio.get_running_loop()
+        session = ExchangeBase._http_session
+        if session is None or session.closed or ExchangeBase._http_session_loop is not loop:
+            session = aiohttp.ClientSession()
+            ExchangeBase._http_session = session
+            ExchangeBase._http_session_loop = loop
+        return session
+
+    @staticmethod
+    def current_timestamp() -> str:
+        """
+        Return the current local time formatted as "%Y-%m-%d %H:%M:%S".
+
+        The order book streams timestamp every message they receive; the formatted string
+        is computed once per second instead of calling strftime for each of them.
+
+        Returns:
+            str: The formatted current time.
+        """
+        return format_timestamp(int(time.time()))
+
+    @staticmethod
+    async def close_http_session():
+        """
+        Close the HTTP session shared by all the exchanges, if any.
+        """
+        session = ExchangeBase._http_session
+        ExchangeBase._http_session = None
+        ExchangeBase._http_session_loop = None
+        if session is not None and not session.closed:
+            await session.close()
+
+    async def cached_trading_pairs(self) -> Dict[str, str]:
+        """
+        Trading pairs of the exchange, as returned by get_trading_pairs().
+
+        They are kept for TRADING_PAIRS_TTL seconds, so converting a symbol to the exchange format
+        is usually a dict lookup. When they are fetched again, the blocking request runs in a
+        worker thread instead of the event loop.
+
+        Returns:
+            Dict[str, str]: Trading pair symbols mapped to the symbols of the exchange.
+        """
+        if self._trading_pairs is None or time.monotonic() - self._trading_pairs_time > TRADING_PAIRS_TTL:
+            trading_pairs = await asyncio.to_thread(self.get_trading_pairs)
+            self._trading_pairs = trading_pairs
+            self._symbols = frozenset(trading_pairs)
+            self._trading_pairs_time = time.monotonic()
+        return self._trading_pairs
+
+    async def cached_symbols(self) -> frozenset:
+        """
+        Symbols of the trading pairs of the exchange (in the common format, e.g. "BTCUSDT"),
+        kept in a frozenset so validating a symbol is a set lookup.
+
+        Returns:
+            frozenset: The trading pair symbols.
+        """
+        await self.cached_trading_pairs()
+        return self._symbols
+
     @abstractmethod
     def get_klines_data(self, symbol: str, interval: str, limit: int, start_time: datetime,
                         end_time: datetime) -> pd.DataFrame:
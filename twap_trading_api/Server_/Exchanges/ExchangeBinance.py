@@ -1,9 +1,8 @@
-from twap_trading_api.Server_.Exchanges.ExchangeBase import ExchangeBase
+from twap_trading_api.Server_.Exchanges.ExchangeBase import ExchangeBase, TRADING_PAIRS_TIMEOUT
 import requests
 import asyncio
 import websockets
-import aiohttp
-import json
+import orjson
 import pandas as pd
 from typing import Dict, List, Tuple
 from datetime import datetime, timedelta
@@ -41,7 +40,7 @@ class ExchangeBinance(ExchangeBase):
             In this case, Bybit sends directly the good format.
         """
         # Send a GET request to retrieve all trading pairs
-        response = requests.get(f"{self.BINANCE_REST_URL}/exchangeInfo")
+        response = requests.get(f"{self.BINANCE_REST_URL}/exchangeInfo", timeout=TRADING_PAIRS_TIMEOUT)
         data = response.json()
         # Extract and return a dictionary mapping trading pair symbols
         return {symbol["symbol"]: symbol["symbol"] for symbol in data["symbols"]}
@@ -65,66 +64,66 @@ class ExchangeBinance(ExchangeBase):
         if interval not in self.valid_timeframe:
             raise ValueError(f"Intervalle non supporté: {interval}")
 
-        # Creation of an asynchronous HTTP session
-        async with aiohttp.ClientSession() as session:
-            endpoint = f"{self.BINANCE_REST_URL}/klines"
-            klines = []
-
-            # Continue fetching data while the start time is before end_time
-            while start_time < end_time:
-                params = {
-                    "symbol": symbol,
-                    "interval": interval,
-                    "startTime": int(start_time.timestamp() * 1000),
-                    "limit": limit
-                }
-
-                # Send GET request with parameters
-                async with session.get(endpoint, params=params) as response:
-                    data = await response.json()
-
-                    # Check if the response contains valid data
-                    if isinstance(data, list):
-                        if not data:
+        # Asynchronous HTTP session shared by all the exchanges
+        session = self.get_http_session()
+        endpoint = f"{self.BINANCE_REST_URL}/klines"
+        klines = []
+
+        # Continue fetching data while the start time is before end_time
+        while start_time < end_time:
+            params = {
+                "symbol": symbol,
+                "interval": interval,
+                "startTime": int(start_time.timestamp() * 1000),
+                "limit": limit
+            }
+
+            # Send GET request with parameters
+            async with session.get(endpoint, params=params) as response:
+                data = await response.json()
+
+                # Check if the response contains valid data
+                if isinstance(data, list):
+                    if not data:
+                        break
+
+                    # Process each kline in the response
+                    for kline in data:
+                        kline_time = datetime.utcfromtimestamp(kline[0] / 1000)
+                        if kline_time > end_time:
+                            # If the kline timestamp exceeds end_time, exit the loop
                             break
 
-                        # Process each kline in the response
-                        for kline in data:
-                            kline_time = datetime.utcfromtimestamp(kline[0] / 1000)
-                            if kline_time > end_time:
-                                # If the kline timestamp exceeds end_time, exit the loop
-                                break
+                        # Add selected kline fields: timestamp, open, high, low, close, volume
+                        klines.append([kline[0], kline[1], kline[2], kline[3], kline[4], kline[5]])
 
-                            # Add selected kline fields: timestamp, open, high, low, close, volume
-                            klines.append([kline[0], kline[1], kline[2], kline[3], kline[4], kline[5]])
+                    # Update the start_time to one interval after the last kline's timestamp
+                    last_candle_time = datetime.utcfromtimestamp(data[-1][0] / 1000)
+                    start_time = last_candle_time + timedelta(minutes=self.valid_timeframe[interval])
 
-                        # Update the start_time to one interval after the last kline's timestamp
-                        last_candle_time = datetime.utcfromtimestamp(data[-1][0] / 1000)
-                        start_time = last_candle_time + timedelta(minutes=self.valid_timeframe[interval])
-
-                        # Pause for 1 second to respect API rate limits
-                        await asyncio.sleep(1)
-                    else:
-                        # If the response is not a list (e.g., error), print error
-                        print(data, 'sleeping...', symbol)
-                        await asyncio.sleep(5)
+                    # Pause for 1 second to respect API rate limits
+                    await asyncio.sleep(1)
+                else:
+                    # If the response is not a list (e.g., error), print error
+                    print(data, 'sleeping...', symbol)
+                    await asyncio.sleep(5)
 
-            # Create a DataFrame with the selected kline data columns
-            df = pd.DataFrame(klines, columns=['Timestamp', 'Open', 'High', 'Low', 'Close', 'Volume'])
+        # Create a DataFrame with the selected kline data columns
+        df = pd.DataFrame(klines, columns=['Timestamp', 'Open', 'High', 'Low', 'Close', 'Volume'])
 
-            # Remove duplicate rows
-            df.drop_duplicates(inplace=True)
+        # Remove duplicate rows
+        df.drop_duplicates(inplace=True)
 
-            # Convert the timestamp column from milliseconds to datetime
-            df['Timestamp'] = pd.to_datetime(df['Timestamp'].astype(float), unit='ms')
+        # Convert the timestamp column from milliseconds to datetime
+        df['Timestamp'] = pd.to_datetime(df['Timestamp'].astype(float), unit='ms')
 
-            # Set the timestamp as the index
-            df.set_index('Timestamp', inplace=True)
+        # Set the timestamp as the index
+        df.set_index('Timestamp', inplace=True)
 
-            # Convert to float (previously str)
-            df = df.astype(float)
+        # Convert to float (previously str)
+        df = df.astype(float)
 
-            return df
+        return df
 
     def update_order_book(self, asks: Dict[str, str], bids: Dict[str, str]):
         """
@@ -183,8 +182,8 @@ class ExchangeBinance(ExchangeBase):
 
                 while True:
                     response = await websocket.recv()
-                    data = json.loads(response)
-                    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    data = orjson.loads(response)
+                    timestamp = self.current_timestamp()
 
                     # Update local order book with received data
                     self.update_order_book(data["asks"], data["bids"])
@@ -199,8 +198,6 @@ class ExchangeBinance(ExchangeBase):
                     else:
                         yield {"bids": dict(top_bids), "asks": dict(top_asks)}
 
-                    await asyncio.sleep(1)
-
         except Exception as e:
             print(f"WebSocket connection error: {e}")
             await asyncio.sleep(1)
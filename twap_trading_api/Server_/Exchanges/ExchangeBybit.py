@@ -1,12 +1,13 @@
-from twap_trading_api.Server_.Exchanges.ExchangeBase import ExchangeBase
+from twap_trading_api.Server_.Exchanges.ExchangeBase import ExchangeBase, TRADING_PAIRS_TIMEOUT
 import requests
 import asyncio
-import aiohttp
 import websockets
-import json
+import orjson
 import time
 import pandas as pd
 from typing import Dict, List, Tuple
+from heapq import nlargest, nsmallest
+from operator import itemgetter
 from datetime import datetime, timedelta
 
 class ExchangeBybit(ExchangeBase):
@@ -47,7 +48,8 @@ class ExchangeBybit(ExchangeBase):
             In this case, Bybit sends directly the good format.
         """
         # Send a GET request to retrieve all trading pairs
-        response = requests.get(f"{self.BYBIT_REST_URL}/market/instruments-info?category=spot")
+        response = requests.get(f"{self.BYBIT_REST_URL}/market/instruments-info?category=spot",
+                                timeout=TRADING_PAIRS_TIMEOUT)
         data = response.json()
         # Extract and return a dictionary mapping trading pair symbols
         return {symbol["symbol"]: symbol["symbol"] for symbol in data["result"]["list"]}
@@ -71,70 +73,70 @@ class ExchangeBybit(ExchangeBase):
         if interval not in self.valid_timeframe:
             raise ValueError(f"Intervalle non supporté: {interval}")
 
-        # Creation of an asynchronous HTTP session
-        async with aiohttp.ClientSession() as session:
-            endpoint = f"{self.BYBIT_REST_URL}/market/kline"
-            klines = []
-
-            # Continue fetching data while the start time is before end_time
-            while start_time < end_time:
-                params = {
-                    "category": "spot",
-                    "symbol": symbol,
-                    "interval": self.valid_timeframe[interval],
-                    "start": int((start_time + timedelta(hours=1)).timestamp() * 1000),
-                    "limit": 200
-                }
-
-                # Send GET request with parameters
-                async with session.get(endpoint, params=params) as response:
-                    data = await response.json()
-                    data = data["result"]["list"]
-                    # Inverse the list to have dates in ascending order
-                    data = data[::-1]
-
-                    # Check if the response contains valid data
-                    if isinstance(data, list):
-                        if not data:
+        # Asynchronous HTTP session shared by all the exchanges
+        session = self.get_http_session()
+        endpoint = f"{self.BYBIT_REST_URL}/market/kline"
+        klines = []
+
+        # Continue fetching data while the start time is before end_time
+        while start_time < end_time:
+            params = {
+                "category": "spot",
+                "symbol": symbol,
+                "interval": self.valid_timeframe[interval],
+                "start": int((start_time + timedelta(hours=1)).timestamp() * 1000),
+                "limit": 200
+            }
+
+            # Send GET request with parameters
+            async with session.get(endpoint, params=params) as response:
+                data = await response.json()
+                data = data["result"]["list"]
+                # Inverse the list to have dates in ascending order
+                data = data[::-1]
+
+                # Check if the response contains valid data
+                if isinstance(data, list):
+                    if not data:
+                        break
+
+                    # Process each kline in the response
+                    for kline in data:
+                        kline_time = datetime.utcfromtimestamp(int(kline[0]) / 1000)
+                        if kline_time > end_time:
+                            # If the kline timestamp exceeds end_time, exit the loop
                             break
 
-                        # Process each kline in the response
-                        for kline in data:
-                            kline_time = datetime.utcfromtimestamp(int(kline[0]) / 1000)
-                            if kline_time > end_time:
-                                # If the kline timestamp exceeds end_time, exit the loop
-                                break
+                        # Add selected kline fields: timestamp, open, high, low, close, volume
+                        klines.append([int(kline[0]), kline[1], kline[2], kline[3], kline[4], kline[5]])
 
-                            # Add selected kline fields: timestamp, open, high, low, close, volume
-                            klines.append([int(kline[0]), kline[1], kline[2], kline[3], kline[4], kline[5]])
+                    # Update the start_time to one interval after the last kline's timestamp
+                    last_candle_time = datetime.utcfromtimestamp(int(data[-1][0]) / 1000)
+                    start_time = last_candle_time + timedelta(minutes=self.minutes_timeframe[interval])
 
-                        # Update the start_time to one interval after the last kline's timestamp
-                        last_candle_time = datetime.utcfromtimestamp(int(data[-1][0]) / 1000)
-                        start_time = last_candle_time + timedelta(minutes=self.minutes_timeframe[interval])
+                    # Pause for 1 second to respect API rate limits
+                    await asyncio.sleep(1)
+                else:
+                    # If the response is not a list (e.g., error), print error
+                    print(data, 'sleeping...', symbol)
+                    await asyncio.sleep(5)
 
-                        # Pause for 1 second to respect API rate limits
-                        await asyncio.sleep(1)
-                    else:
-                        # If the response is not a list (e.g., error), print error
-                        print(data, 'sleeping...', symbol)
-                        await asyncio.sleep(5)
+        # Create a DataFrame with the selected kline data columns
+        df = pd.DataFrame(klines, columns=['Timestamp', 'Open', 'High', 'Low', 'Close', 'Volume'])
 
-            # Create a DataFrame with the selected kline data columns
-            df = pd.DataFrame(klines, columns=['Timestamp', 'Open', 'High', 'Low', 'Close', 'Volume'])
+        # Remove duplicate rows
+        df.drop_duplicates(inplace=True)
 
-            # Remove duplicate rows
-            df.drop_duplicates(inplace=True)
+        # Convert the timestamp column from milliseconds to datetime objects
+        df['Timestamp'] = pd.to_datetime(df['Timestamp'].astype(float), unit='ms')
 
-            # Convert the timestamp column from milliseconds to datetime objects
-            df['Timestamp'] = pd.to_datetime(df['Timestamp'].astype(float), unit='ms')
+        # Set the timestamp as the index
+        df.set_index('Timestamp', inplace=True)
 
-            # Set the timestamp as the index
-            df.set_index('Timestamp', inplace=True)
+        # Convert to float (previously str)
+        df = df.astype(float)
 
-            # Convert to float (previously str)
-            df = df.astype(float)
-
-            return df
+        return df
 
     def update_order_book(self, side: str, price: float, volume: float):
         """
@@ -203,15 +205,15 @@ class ExchangeBybit(ExchangeBase):
         try:
             async with websockets.connect(self.BYBIT_WS_URL) as websocket:
                 # Send subscription request to the WebSocket
-                await websocket.send(json.dumps(subscribe_message))
+                await websocket.send(orjson.dumps(subscribe_message).decode())
                 print(f"📶 Connecting to Bybit WebSocket for {symbol}")
                 last_update_time = time.time()
 
                 while True:
                     # Receive a response from the WebSocket
                     response = await websocket.recv()
-                    data = json.loads(response)
-                    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    data = orjson.loads(response)
+                    timestamp = self.current_timestamp()
 
                     if "topic" in data and data["topic"].startswith("orderbook"):
                         # Process the initial snapshot of the order book
@@ -228,8 +230,8 @@ class ExchangeBybit(ExchangeBase):
 
                         # Update and display order book every second
                         if time.time() - last_update_time >= 1:
-                            top_bids = sorted(self.bids.items(), key=lambda x: -x[0])[:10]
-                            top_asks = sorted(self.asks.items(), key=lambda x: x[0])[:10]
+                            top_bids = nlargest(10, self.bids.items(), key=itemgetter(0))
+                            top_asks = nsmallest(10, self.asks.items(), key=itemgetter(0))
 
                             # Display order book if enabled, otherwise return data
                             if display:
@@ -1,13 +1,14 @@
-from twap_trading_api.Server_.Exchanges.ExchangeBase import ExchangeBase
+from twap_trading_api.Server_.Exchanges.ExchangeBase import ExchangeBase, TRADING_PAIRS_TIMEOUT
 import requests
 import websockets
 import asyncio
-import aiohttp
-import json
+import orjson
 import time
 import jwt
 import pandas as pd
 from typing import Dict, List, Tuple
+from heapq import nlargest, nsmallest
+from operator import itemgetter
 from datetime import datetime, timedelta
 
 
@@ -86,7 +87,7 @@ class ExchangeCoinbase(ExchangeBase):
             In this case, Coinbase sends symbols with "-" between each element.
         """
         # Send a GET request to retrieve all trading pairs
-        response = requests.get(f"{self.COINBASE_REST_URL}/products")
+        response = requests.get(f"{self.COINBASE_REST_URL}/products", timeout=TRADING_PAIRS_TIMEOUT)
         data = response.json()
         # Extract and return a dictionary mapping trading pair symbols
         return {symbol["id"].replace('-', ''): symbol["id"] for symbol in
@@ -112,69 +113,69 @@ class ExchangeCoinbase(ExchangeBase):
             raise ValueError(f"Intervalle non supporté: {interval}")
 
         # Turn the symbol into Coinbase format and get the granularity (interval)
-        symbol = self.get_trading_pairs()[symbol]
+        symbol = (await self.cached_trading_pairs())[symbol]
         granularity = self.valid_timeframe[interval]
 
-        # Creation of an asynchronous HTTP session
-        async with aiohttp.ClientSession() as session:
-            endpoint = f"{self.COINBASE_REST_URL}/products/{symbol}/candles"
-            klines = []
-
-            # Continue fetching data while the start time is before end_time
-            while start_time < end_time:
-                params = {
-                    "start": start_time.isoformat(),
-                    "end": (start_time + timedelta(minutes=granularity * limit)).isoformat(),
-                    "granularity": interval
-                }
-
-                # Send GET request with parameters
-                async with session.get(endpoint, params=params) as response:
-                    data = await response.json()
-                    # Inverse the list to have dates in ascending order
-                    data = data[::-1]
-
-                    # Check if the response contains valid data
-                    if isinstance(data, list):
-                        if not data:
+        # Asynchronous HTTP session shared by all the exchanges
+        session = self.get_http_session()
+        endpoint = f"{self.COINBASE_REST_URL}/products/{symbol}/candles"
+        klines = []
+
+        # Continue fetching data while the start time is before end_time
+        while start_time < end_time:
+            params = {
+                "start": start_time.isoformat(),
+                "end": (start_time + timedelta(minutes=granularity * limit)).isoformat(),
+                "granularity": interval
+            }
+
+            # Send GET request with parameters
+            async with session.get(endpoint, params=params) as response:
+                data = await response.json()
+                # Inverse the list to have dates in ascending order
+                data = data[::-1]
+
+                # Check if the response contains valid data
+                if isinstance(data, list):
+                    if not data:
+                        break
+
+                    # Process each kline in the response
+                    for kline in data:
+                        kline_time = datetime.utcfromtimestamp(kline[0])  # Timestamp en secondes
+                        # If the kline timestamp exceeds end_time, exit the loop
+                        if kline_time > end_time:
                             break
 
-                        # Process each kline in the response
-                        for kline in data:
-                            kline_time = datetime.utcfromtimestamp(kline[0])  # Timestamp en secondes
-                            # If the kline timestamp exceeds end_time, exit the loop
-                            if kline_time > end_time:
-                                break
+                        # Add selected kline fields: timestamp, open, high, low, close, volume
+                        klines.append([kline[0], kline[3], kline[2], kline[1], kline[4], kline[5]])
 
-                            # Add selected kline fields: timestamp, open, high, low, close, volume
-                            klines.append([kline[0], kline[3], kline[2], kline[1], kline[4], kline[5]])
+                    # Update the start_time to one interval after the last kline's timestamp
+                    last_candle_time = datetime.utcfromtimestamp(data[-1][0])
+                    start_time = last_candle_time + timedelta(minutes=granularity)
 
-                        # Update the start_time to one interval after the last kline's timestamp
-                        last_candle_time = datetime.utcfromtimestamp(data[-1][0])
-                        start_time = last_candle_time + timedelta(minutes=granularity)
+                    # Pause for 1 second to respect API rate limits
+                    await asyncio.sleep(1)
+                else:
+                    print(data, 'sleeping...', symbol)
+                    await asyncio.sleep(5)
 
-                        # Pause for 1 second to respect API rate limits
-                        await asyncio.sleep(1)
-                    else:
-                        print(data, 'sleeping...', symbol)
-                        await asyncio.sleep(5)
+        # Create a DataFrame with the selected kline data columns
+        df = pd.DataFrame(klines, columns=['Timestamp', 'Open', 'High', 'Low', 'Close', 'Volume'])
 
-            # Create a DataFrame with the selected kline data columns
-            df = pd.DataFrame(klines, columns=['Timestamp', 'Open', 'High', 'Low', 'Close', 'Volume'])
+        # Remove duplicate rows
+        df.drop_duplicates(inplace=True)
 
-            # Remove duplicate rows
-            df.drop_duplicates(inplace=True)
+        # Convert the timestamp column from seconds to datetime
+        df['Timestamp'] = pd.to_datetime(df['Timestamp'], unit='s')
 
-            # Convert the timestamp column from seconds to datetime
-            df['Timestamp'] = pd.to_datetime(df['Timestamp'], unit='s')
+        # Set the timestamp as the index
+        df.set_index('Timestamp', inplace=True)
 
-            # Set the timestamp as the index
-            df.set_index('Timestamp', inplace=True)
+        # Convert to float (previously str)
+        df = df.astype(float)
 
-            # Convert to float (previously str)
-            df = df.astype(float)
-
-            return df
+        return df
 
     def update_order_book(self, side: str, price: float, volume: float):
         """
@@ -236,7 +237,7 @@ class ExchangeCoinbase(ExchangeBase):
             Dict[Dict, Dict]: Dictionary containing bid and ask prices.
         """
         # Correct symbol format
-        symbol_formatted = self.get_trading_pairs()[symbol]
+        symbol_formatted = (await self.cached_trading_pairs())[symbol]
         # Generate a token for authentification (required for Coinbase)
         token = self.get_jwt_token()
         # Subscribe request to be sent to the WebSocket
@@ -249,15 +250,15 @@ class ExchangeCoinbase(ExchangeBase):
         try:
             async with websockets.connect(self.COINBASE_WS_URL) as websocket:
                 # Send subscription request to the WebSocket
-                await websocket.send(json.dumps(subscribe_message))
+                await websocket.send(orjson.dumps(subscribe_message).decode())
                 print(f"📶 Connecting to Coinbase WebSocket for {symbol}")
                 last_update_time = time.time()
 
                 while True:
                     # Receive a response from the WebSocket
                     response = await websocket.recv()
-                    data = json.loads(response)
-                    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    data = orjson.loads(response)
+                    timestamp = self.current_timestamp()
 
                     # Check if the message contains order book updates
                     if data.get("channel") == "l2_data":
@@ -273,8 +274,8 @@ class ExchangeCoinbase(ExchangeBase):
 
                         # Update and display order book every second
                         if time.time() - last_update_time >= 1:
-                            top_bids = sorted(self.bids.items(), key=lambda x: -x[0])[:10]
-                            top_asks = sorted(self.asks.items(), key=lambda x: x[0])[:10]
+                            top_bids = nlargest(10, self.bids.items(), key=itemgetter(0))
+                            top_asks = nsmallest(10, self.asks.items(), key=itemgetter(0))
 
                             # Display order book if enabled, otherwise return data
                             if display:
@@ -1,12 +1,13 @@
-from twap_trading_api.Server_.Exchanges.ExchangeBase import ExchangeBase
+from twap_trading_api.Server_.Exchanges.ExchangeBase import ExchangeBase, TRADING_PAIRS_TIMEOUT
 import requests
 import asyncio
-import aiohttp
 import websockets
-import json
+import orjson
 import time
 import pandas as pd
 from typing import Dict, Tuple, List
+from heapq import nlargest, nsmallest
+from operator import itemgetter
 from datetime import datetime, timedelta
 
 class ExchangeKucoin(ExchangeBase):
@@ -36,20 +37,22 @@ class ExchangeKucoin(ExchangeBase):
         self.bids = {}
         self.asks = {}
 
-    def get_ws_token(self) -> str:
+    async def get_ws_token(self) -> str:
         """
             Retrieve a temporary WebSocket token for public market data.
         Returns:
             str: A temporary token used for WebSocket authentication.
         """
         # Send POST request to obtain a public WebSocket token
-        response = requests.post(f"{self.KUCOIN_REST_URL}/api/v1/bullet-public")
-        # Check if the request was successful
-        if response.status_code == 200:
-            # Extract and return the token from the response
-            return response.json()["data"]["token"]
-        else:
-            raise Exception(f"Error fetching WebSocket token: {response.text}")
+        session = self.get_http_session()
+        async with session.post(f"{self.KUCOIN_REST_URL}/api/v1/bullet-public") as response:
+            # Check if the request was successful
+            if response.status == 200:
+                # Extract and return the token from the response
+                data = await response.json()
+                return data["data"]["token"]
+            else:
+                raise Exception(f"Error fetching WebSocket token: {await response.text()}")
 
     def get_trading_pairs(self) -> Dict[str, str]:
         """
@@ -61,7 +64,7 @@ class ExchangeKucoin(ExchangeBase):
             In this case, Kucoin sends symbols with "-" between each element.
         """
         # Send a GET request to retrieve all trading pairs
-        response = requests.get(f"{self.KUCOIN_REST_URL}/api/v2/symbols")
+        response = requests.get(f"{self.KUCOIN_REST_URL}/api/v2/symbols", timeout=TRADING_PAIRS_TIMEOUT)
         data = response.json()
         # Extract and return a dictionary mapping trading pair symbols
         return {symbol["symbol"].replace('-', ''): symbol["symbol"] for symbol in data["data"]}
@@ -86,70 +89,70 @@ class ExchangeKucoin(ExchangeBase):
             raise ValueError(f"Intervalle non supporté: {interval}")
 
         # Turn the symbol into Kucoin format
-        symbol = self.get_trading_pairs()[symbol]
-
-        # Creation of an asynchronous HTTP session
-        async with aiohttp.ClientSession() as session:
-            endpoint = f"{self.KUCOIN_REST_URL}/api/v1/market/candles"
-            klines = []
-
-            # Continue fetching data while the start time is before end_time
-            while start_time < end_time:
-                params = {
-                    "symbol": symbol,
-                    "type": self.valid_timeframe[interval],
-                    "startAt": int(start_time.timestamp()),
-                }
-
-                # Send GET request with parameters
-                async with session.get(endpoint, params=params) as response:
-                    data = await response.json()
-                    data = data["data"]
-                    # Inverse the list to have dates in ascending order
-                    data = data[::-1]
-
-                    # Check if the response contains valid data
-                    if isinstance(data, list):
-                        if not data:
+        symbol = (await self.cached_trading_pairs())[symbol]
+
+        # Asynchronous HTTP session shared by all the exchanges
+        session = self.get_http_session()
+        endpoint = f"{self.KUCOIN_REST_URL}/api/v1/market/candles"
+        klines = []
+
+        # Continue fetching data while the start time is before end_time
+        while start_time < end_time:
+            params = {
+                "symbol": symbol,
+                "type": self.valid_timeframe[interval],
+                "startAt": int(start_time.timestamp()),
+            }
+
+            # Send GET request with parameters
+            async with session.get(endpoint, params=params) as response:
+                data = await response.json()
+                data = data["data"]
+                # Inverse the list to have dates in ascending order
+                data = data[::-1]
+
+                # Check if the response contains valid data
+                if isinstance(data, list):
+                    if not data:
+                        break
+
+                    # Process each kline in the response
+                    for kline in data:
+                        kline_time = datetime.utcfromtimestamp(int(kline[0]))
+                        if kline_time > end_time:
+                            # If the kline timestamp exceeds end_time, exit the loop
                             break
 
-                        # Process each kline in the response
-                        for kline in data:
-                            kline_time = datetime.utcfromtimestamp(int(kline[0]))
-                            if kline_time > end_time:
-                                # If the kline timestamp exceeds end_time, exit the loop
-                                break
-
-                            # Add selected kline fields: timestamp, open, high, low, close, volume
-                            klines.append([int(kline[0]), kline[1], kline[3], kline[4], kline[2], kline[5]])
+                        # Add selected kline fields: timestamp, open, high, low, close, volume
+                        klines.append([int(kline[0]), kline[1], kline[3], kline[4], kline[2], kline[5]])
 
-                        # Update the start_time to one interval after the last kline's timestamp
-                        last_candle_time = datetime.utcfromtimestamp(int(data[-1][0]))
-                        start_time = last_candle_time + timedelta(minutes=self.minutes_timeframe[interval])
+                    # Update the start_time to one interval after the last kline's timestamp
+                    last_candle_time = datetime.utcfromtimestamp(int(data[-1][0]))
+                    start_time = last_candle_time + timedelta(minutes=self.minutes_timeframe[interval])
 
-                        # Pause for 1 second to respect API rate limits
-                        await asyncio.sleep(1)
-                    else:
-                        # If the response is not a list (e.g., error), print error
-                        print(data, 'sleeping...', symbol)
-                        await asyncio.sleep(5)
+                    # Pause for 1 second to respect API rate limits
+                    await asyncio.sleep(1)
+                else:
+                    # If the response is not a list (e.g., error), print error
+                    print(data, 'sleeping...', symbol)
+                    await asyncio.sleep(5)
 
-            # Create a DataFrame with the selected kline data columns
-            df = pd.DataFrame(klines, columns=['Timestamp', 'Open', 'High', 'Low', 'Close', 'Volume'])
+        # Create a DataFrame with the selected kline data columns
+        df = pd.DataFrame(klines, columns=['Timestamp', 'Open', 'High', 'Low', 'Close', 'Volume'])
 
-            # Remove duplicate rows
-            df.drop_duplicates(inplace=True)
+        # Remove duplicate rows
+        df.drop_duplicates(inplace=True)
 
-            # Convert the timestamp column from seconds to datetime objects
-            df['Timestamp'] = pd.to_datetime(df['Timestamp'].astype(float), unit='s')
+        # Convert the timestamp column from seconds to datetime objects
+        df['Timestamp'] = pd.to_datetime(df['Timestamp'].astype(float), unit='s')
 
-            # Set the timestamp as the index
-            df.set_index('Timestamp', inplace=True)
+        # Set the timestamp as the index
+        df.set_index('Timestamp', inplace=True)
 
-            # Convert to float (previously str)
-            df = df.astype(float)
+        # Convert to float (previously str)
+        df = df.astype(float)
 
-            return df
+        return df
 
     def update_order_book(self, side: str, price: float, volume: float):
         """
@@ -199,7 +202,7 @@ class ExchangeKucoin(ExchangeBase):
         print(current_order_book.to_string(index=True, float_format="{:.4f}".format))
         print("="*60)
 
-    def get_order_book_snapshot(self, symbol: str):
+    async def get_order_book_snapshot(self, symbol: str):
         """
         Fetch the latest order book snapshot for a given trading pair.
 
@@ -211,15 +214,16 @@ class ExchangeKucoin(ExchangeBase):
             "symbol": symbol
         }
         # Send GET request with parameters for the order book snapshot
-        response = requests.get(f"{self.KUCOIN_REST_URL}/api/v1/market/orderbook/level2_20", params=params)
-
-        # Check if the request was successful
-        if response.status_code == 200:
-            data = response.json()["data"]
-            self.bids = {float(price): float(volume) for price, volume in data["bids"][0:10]}
-            self.asks = {float(price): float(volume) for price, volume in data["asks"][0:10]}
-        else:
-            raise Exception(f"Error fetching order book snapshot: {response.text}")
+        session = self.get_http_session()
+        async with session.get(f"{self.KUCOIN_REST_URL}/api/v1/market/orderbook/level2_20",
+                               params=params) as response:
+            # Check if the request was successful
+            if response.status == 200:
+                data = (await response.json())["data"]
+                self.bids = {float(price): float(volume) for price, volume in data["bids"][0:10]}
+                self.asks = {float(price): float(volume) for price, volume in data["asks"][0:10]}
+            else:
+                raise Exception(f"Error fetching order book snapshot: {await response.text()}")
 
     async def get_order_book(self, symbol: str, display: bool = True) -> Dict[Dict, Dict]:
         """
@@ -233,11 +237,11 @@ class ExchangeKucoin(ExchangeBase):
             Dict[Dict, Dict]: Dictionary containing bid and ask prices.
         """
         # Correct symbol format
-        symbol_formatted = self.get_trading_pairs()[symbol]
+        symbol_formatted = (await self.cached_trading_pairs())[symbol]
         # Generate a token for authentification (required for Kucoin)
-        token = self.get_ws_token()
+        token = await self.get_ws_token()
         # Fetch the latest order book snapshot
-        self.get_order_book_snapshot(symbol_formatted)
+        await self.get_order_book_snapshot(symbol_formatted)
         # Subscribe request to be sent to the WebSocket
         subscribe_message = {
             "id": str(int(time.time()*1000)),
@@ -248,15 +252,15 @@ class ExchangeKucoin(ExchangeBase):
         try:
             async with websockets.connect(f"{self.KUCOIN_WS_URL}?token={token}") as websocket:
                 # Send subscription request to the WebSocket
-                await websocket.send(json.dumps(subscribe_message))
+                await websocket.send(orjson.dumps(subscribe_message).decode())
                 print(f"📶 Connecting to Kucoin WebSocket for {symbol}")
                 last_update_time = time.time()
 
                 while True:
                     # Receive a response from the WebSocket
                     response = await websocket.recv()
-                    data = json.loads(response)
-                    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    data = orjson.loads(response)
+                    timestamp = self.current_timestamp()
 
                     if "topic" in data and data["topic"].startswith("/market/level2"):
                         # Process each update and modify the local order book
@@ -270,8 +274,8 @@ class ExchangeKucoin(ExchangeBase):
 
                         # Update and display order book every second
                         if time.time() - last_update_time >= 1:
-                            top_bids = sorted(self.bids.items(), key=lambda x: -x[0])[:10]
-                            top_asks = sorted(self.asks.items(), key=lambda x: x[0])[:10]
+                            top_bids = nlargest(10, self.bids.items(), key=itemgetter(0))
+                            top_asks = nsmallest(10, self.asks.items(), key=itemgetter(0))
 
                             # Display order book if enabled, otherwise return data
                             if display:
@@ -1,12 +1,44 @@
+from twap_trading_api.Server_.Exchanges.ExchangeBase import ExchangeBase
 from twap_trading_api.Server_.Exchanges.ExchangeBinance import ExchangeBinance
 from twap_trading_api.Server_.Exchanges.ExchangeCoinbase import ExchangeCoinbase
 from twap_trading_api.Server_.Exchanges.ExchangeBybit import ExchangeBybit
 from twap_trading_api.Server_.Exchanges.ExchangeKucoin import ExchangeKucoin
-from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Set
+from heapq import nlargest, nsmallest
+from operator import itemgetter
 import asyncio
+import numpy as np
 import pandas as pd
 
+# Interval (in seconds) during which the exchange updates are coalesced into one aggregated order book
+AGGREGATION_INTERVAL = 0.2
+
+
+def top_levels(levels: Dict, depth: int = 10, descending: bool = False) -> Dict:
+    """
+    Select the best levels of one side of an order book without sorting all of its levels.
+
+    Args:
+        levels (dict): Prices mapped to their (volume, source).
+        depth (int, optional): Number of levels to keep. Defaults to 10.
+        descending (bool, optional): True for bids (highest prices first). Defaults to False.
+
+    Returns:
+        dict: The best levels, ordered from the best price.
+    """
+    prices = np.fromiter(levels.keys(), dtype=np.float64, count=len(levels))
+    keys = -prices if descending else prices
+
+    # Partial sort: only the selected levels are sorted
+    if len(keys) > depth:
+        best = np.argpartition(keys, depth)[:depth]
+    else:
+        best = np.arange(len(keys))
+    best = best[np.argsort(keys[best])]
+
+    return {price: levels[price] for price in prices[best].tolist()}
+
+
 class ExchangeMulti:
     """
     Class to aggregate and display order book data from multiple exchanges.
@@ -31,9 +63,9 @@ class ExchangeMulti:
             bids (dict): Aggregated bid prices and volumes.
             asks (dict): Aggregated ask prices and volumes.
         """
-        # Sort bids in descending order and asks in ascending order
-        top_bids = sorted(bids.items(), key=lambda x: -x[0])[:10]
-        top_asks = sorted(asks.items(), key=lambda x: x[0])[:10]
+        # Select the 10 best bids (highest prices) and asks (lowest prices)
+        top_bids = nlargest(10, bids.items(), key=itemgetter(0))
+        top_asks = nsmallest(10, asks.items(), key=itemgetter(0))
 
         # Create a DataFrame to display the order book
         current_order_book = pd.DataFrame({
@@ -58,6 +90,9 @@ class ExchangeMulti:
         """
         Aggregate order book data from multiple exchanges.
 
+        The exchange streams do not reconnect: an exchange whose stream ended is left out of the
+        aggregation, and the generator ends once the streams of all the exchanges ended.
+
         Args:
             symbol (str): Trading pair symbol (e.g., "BTCUSDT").
             display (bool, optional): Whether to print the order book. Defaults to True.
@@ -65,59 +100,89 @@ class ExchangeMulti:
         Yields:
             dict: Aggregated bid and ask prices.
         """
-        # Create tasks to fetch order books from all exchanges
-        tasks = [(exchange, exchange.get_order_book(symbol, display=False)) for exchange in self.exchanges]
-
-        while True:
-            # Gather order book data from all exchanges
-            results = await asyncio.gather(*[self._collect_orders(exchange, task) for exchange, task in tasks])
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            aggregated_bids = {}
-            aggregated_asks = {}
-
-            # Merge order books from all exchanges
-            for exchange, result in results:
-                exchange_name = exchange.__class__.__name__.replace("Exchange", "")
-                bids = result["bids"]
-                asks = result["asks"]
-
-                # Aggregate bid data
-                for price, volume in bids.items():
-                    if price in aggregated_bids:
-                        if aggregated_bids[price][0] < volume:
+        # Each exchange stream is drained by its own task, which only keeps its latest order book
+        latest_order_books = {}
+        running = set(self.exchanges)
+        updated = asyncio.Event()
+        tasks = [asyncio.create_task(self._collect_orders(exchange, exchange.get_order_book(symbol, display=False),
+                                                          latest_order_books, running, updated))
+                 for exchange in self.exchanges]
+
+        try:
+            while True:
+                # Wait for a new order book, then coalesce the updates received during the interval
+                await updated.wait()
+                await asyncio.sleep(AGGREGATION_INTERVAL)
+                updated.clear()
+
+                if not running:
+                    print(f"🛑 All the order book streams of {symbol} ended")
+                    return
+
+                # Wait for the first order book of every running exchange
+                if len(latest_order_books) < len(running):
+                    continue
+
+                results = list(latest_order_books.items())
+                timestamp = ExchangeBase.current_timestamp()
+                aggregated_bids = {}
+                aggregated_asks = {}
+
+                # Merge order books from all exchanges
+                for exchange, result in results:
+                    exchange_name = exchange.__class__.__name__.replace("Exchange", "")
+                    bids = result["bids"]
+                    asks = result["asks"]
+
+                    # Aggregate bid data
+                    for price, volume in bids.items():
+                        if price in aggregated_bids:
+                            if aggregated_bids[price][0] < volume:
+                                aggregated_bids[price] = (volume, exchange_name)
+                        else:
                             aggregated_bids[price] = (volume, exchange_name)
-                    else:
-                        aggregated_bids[price] = (volume, exchange_name)
 
-                # Aggregate ask data
-                for price, volume in asks.items():
-                    if price in aggregated_asks:
-                        if aggregated_asks[price][0] < volume:
+                    # Aggregate ask data
+                    for price, volume in asks.items():
+                        if price in aggregated_asks:
+                            if aggregated_asks[price][0] < volume:
+                                aggregated_asks[price] = (volume, exchange_name)
+                        else:
                             aggregated_asks[price] = (volume, exchange_name)
-                    else:
-                        aggregated_asks[price] = (volume, exchange_name)
 
-            # Sort aggregated order book
-            sorted_bids = dict(sorted(aggregated_bids.items(), key=lambda x: -x[0])[:10])
-            sorted_asks = dict(sorted(aggregated_asks.items(), key=lambda x: x[0])[:10])
+                # Sort aggregated order book
+                sorted_bids = top_levels(aggregated_bids, descending=True)
+                sorted_asks = top_levels(aggregated_asks)
 
-            if display:
-                self.display_order_book(symbol, timestamp, sorted_bids, sorted_asks)
-            else:
-                yield {"bids": dict(sorted_bids), "asks": dict(sorted_asks)}
+                if display:
+                    self.display_order_book(symbol, timestamp, sorted_bids, sorted_asks)
+                else:
+                    yield {"bids": dict(sorted_bids), "asks": dict(sorted_asks)}
+        finally:
+            for task in tasks:
+                task.cancel()
 
-    async def _collect_orders(self, exchange: Dict, order_book_generator):
+    async def _collect_orders(self, exchange, order_book_generator, latest_order_books: Dict,
+                              running: Set, updated: asyncio.Event):
         """
-        Collect the latest order book from an exchange.
+        Collect the order books of an exchange, keeping only the latest one.
+        When the stream ends, its order book is removed so it is no longer aggregated.
 
         Args:
             exchange (object): Exchange instance.
             order_book_generator (async generator): Generator yielding order book data.
-
-        Returns:
-            tuple: (exchange, latest order book data)
+            latest_order_books (dict): Latest order book of each exchange, updated in place.
+            running (set): Exchanges whose stream is still running, updated in place.
+            updated (asyncio.Event): Set whenever a new order book is received or a stream ends.
         """
-        return exchange, await order_book_generator.__anext__()
+        try:
+            async for order_book in order_book_generator:
+                latest_order_books[exchange] = order_book
+                updated.set()
+        finally:
+            latest_order_books.pop(exchange, None)
+            running.discard(exchange)
+            updated.set()
 
 
 async def main():
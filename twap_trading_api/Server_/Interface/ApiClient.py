@@ -0,0 +1,81 @@
+import base64
+import time
+import orjson
+import streamlit as st
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+API_URL = "http://localhost:8000"
+
+
+@st.cache_resource(show_spinner=False)
+def get_session() -> requests.Session:
+    """
+    Creates the HTTP session shared by all the pages.
+
+    The session is cached as a Streamlit resource so it survives reruns, and its
+    connection pool keeps the sockets to the API alive between requests.
+
+    Returns:
+        requests.Session: The pooled session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20,
+                          max_retries=Retry(total=2, backoff_factor=0.2))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+SESSION = get_session()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_exchanges() -> list:
+    """
+    Retrieves the list of available exchanges.
+
+    The list rarely changes, so it is cached for a few minutes instead of being
+    fetched on every rerun. Failed requests raise and are therefore not cached.
+
+    Returns:
+        list: Names of the available exchanges.
+    """
+    response = SESSION.get(f"{API_URL}/exchanges", timeout=5)
+    response.raise_for_status()
+    return response.json().get("exchanges", [])
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_symbols(exchange: str) -> list:
+    """
+    Retrieves the trading pairs available on an exchange.
+
+    Args:
+        exchange (str): Name of the exchange (e.g., "Binance").
+
+    Returns:
+        list: Trading pair symbols of the exchange.
+    """
+    response = SESSION.get(f"{API_URL}/{exchange}/symbols", timeout=5)
+    response.raise_for_status()
+    return response.json().get("symbols", [])
+
+
+def token_expired(token: str) -> bool:
+    """
+    Checks the expiration ("exp" claim) of a JWT locally, without a request to the API.
+    The signature is not verified: the API still validates the token on each request.
+
+    Args:
+        token (str): The access token. Tokens that are not JWTs (e.g. guest mode) are left to the API.
+
+    Returns:
+        bool: True if the token has an expiration date in the past.
+    """
+    try:
+        payload = orjson.loads(base64.urlsafe_b64decode(token.split(".")[1] + "=="))
+        return payload["exp"] < time.time()
+    except (IndexError, KeyError, TypeError, ValueError):
+        return False
@@ -1,41 +1,38 @@
+import os
 import streamlit as st
 import requests
-import pandas as pd
 import plotly.graph_objects as go
 from datetime import date, timedelta
 from plotly.subplots import make_subplots
+from ApiClient import API_URL, SESSION, fetch_exchanges, fetch_symbols
+from Navigation import render_sidebar
 
-API_URL = "http://localhost:8000"
+# pandas and pyarrow are imported lazily, only once klines are fetched
 
-def klines_page():
-    if not st.session_state.get('logged_in', False) and not st.session_state.get('guest_mode', False):
-        st.session_state.page = 'login'
-        st.rerun()
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
 
-    with st.sidebar:
-        st.title("Navigation")
-        if st.session_state.get('guest_mode', False):
-            st.write("👥 Guest Mode")
-        elif st.session_state.get('logged_in', False):
-            st.write(f"✅ Logged in as **{st.session_state.get('username', 'User')}**")
 
-        if st.button("📊 Market Data"):
-            st.session_state.page = 'klines'
-            st.rerun()
+@st.cache_resource(show_spinner=False)
+def load_css(file_name: str) -> str:
+    """
+    Reads a stylesheet of the static folder once, instead of rebuilding it on every rerun.
 
-        if st.button("🔎 Symbols"):
-            st.session_state.page = 'symbols'
-            st.rerun()
+    Args:
+        file_name (str): Name of the CSS file (e.g., "klines.css").
 
-        if st.button("📈 TWAP"):
-            st.session_state.page = 'twap'
-            st.rerun()
+    Returns:
+        str: Content of the stylesheet.
+    """
+    with open(os.path.join(STATIC_DIR, file_name), encoding="utf-8") as css_file:
+        return css_file.read()
+
+
+def klines_page():
+    if not st.session_state.get('logged_in', False) and not st.session_state.get('guest_mode', False):
+        st.session_state.page = 'login'
+        st.rerun()
 
-        if st.button("🚪 Logout"):
-            st.session_state.logged_in = False
-            st.session_state.guest_mode = False
-            st.session_state.page = 'login'
-            st.rerun()
+    render_sidebar()
 
     st.title("Market Data")
 
@@ -83,23 +80,17 @@ def klines_page():
 
         return fig
 
-    # Cache the exchange list (only fetched once at startup)
-    @st.cache_data
+    # Exchange list and trading pairs are cached by the API client (failed requests are not cached)
     def get_exchanges():
         try:
-            response = requests.get(f"{API_URL}/exchanges", timeout=5)
-            if response.status_code == 200:
-                return response.json().get("exchanges", [])
+            return fetch_exchanges()
         except requests.exceptions.RequestException:
             st.sidebar.error("Failed to retrieve exchange list.")
         return []
 
-    # Cache trading pairs (fetch only when exchange changes)
     def get_trading_pairs(exchange):
         try:
-            response = requests.get(f"{API_URL}/{exchange}/symbols", timeout=5)
-            if response.status_code == 200:
-                return response.json().get("symbols", [])
+            return fetch_symbols(exchange)
         except requests.exceptions.RequestException:
             st.sidebar.error("API connection error.")
         return []
@@ -166,67 +157,10 @@ def klines_page():
                                      value=default_end_date)
 
     # Inject CSS for graph and button metric boxes styling
-    st.markdown(
-        """
-        <style>
-        /* Reduce excessive space above boxes */
-        .block-container { padding-top: 3rem;padding-left: 1rem;padding-right:1rem; }
-
-
-        /* Adjust table spacing */
-        .stDataFrame { margin-top:80px !important;margin-left:10px }
-
-        /* Button style */
-        div.stButton > button:first-child {
-            background-color: transparent; /* Transparent background */
-            color: #2962ff; /* Blue text */
-            border: 2px solid #2962ff; /* Blue border */
-            border-radius: 8px; /* Rounded edges */
-            font-size: 16px;
-            font-weight: bold;
-            padding: 6px 12px;
-            transition: all 0.3s ease-in-out;
-        }
-
-        /* Hover effect */
-        div.stButton > button:first-child:hover {
-            background-color: #2962ff; /* Blue background */
-            color: white; /* White text */
-            border: 2px solid #2962ff; /* Blue border */
-        }
-
-        /* Keep styling after clicking */
-        div.stButton > button:first-child:focus,
-        div.stButton > button:first-child:active {
-            background-color: transparent !important; /* Ensure transparency remains */
-            color: #2962ff !important;
-            border-color: #2962ff !important;
-        }
+    st.markdown(f"<style>{load_css('klines.css')}</style>", unsafe_allow_html=True)
 
-        /* Metric boxes style */
-        .metric-box {
-            background-color: #222;  /* Darker Background */
-            border: 1px solid white; /* White Border */
-            border-radius: 10px;
-            padding: 15px;
-            text-align: center;
-            box-shadow: 2px 2px 10px rgba(255, 255, 255, 0.2);
-            width: 100%;
-        }
-        .metric-label {
-            font-size: 18px;
-            font-weight: bold;
-            color: #FFF;
-        }
-        .metric-value {
-            font-size: 22px;
-            font-weight: bold;
-            color: white;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True
-    )
+    # Selection the displayed klines must match
+    selection = (exchange, symbol, interval, start_date, end_date)
 
     # Fetching and displaying data
     if st.sidebar.button("Run"):
@@ -239,13 +173,16 @@ def klines_page():
                 "end_time": end_date.strftime("%Y-%m-%dT23:59:59")
             }
             try:
-                response = requests.get(f"{API_URL}/klines/{exchange}/{symbol}", params=params, timeout=10)
+                response = SESSION.get(f"{API_URL}/klines/{exchange}/{symbol}", params=params, timeout=10)
                 if response.status_code == 200:
                     data = response.json()
                     klines = data.get("klines", {})
                     if not klines:
                         st.warning("No data available for the selected period.")
                     else:
+                        import pandas as pd
+                        import pyarrow as pa
+
                         df = pd.DataFrame.from_dict(klines, orient='index')
                         df.reset_index(inplace=True)
                         df.rename(columns={'index': 'Timestamp'}, inplace=True)
@@ -265,54 +202,51 @@ def klines_page():
                         close_price = df["Close"].iloc[-1]  # Last close price
                         avg_volume = df["Volume"].mean()  # Average volume
 
-                        # Layout for Metric
-                        metric_data = {
-                            "Open": open_price,
-                            "High": high_price,
-                            "Low": low_price,
-                            "Close": close_price,
-                            "Avg Volume": avg_volume
+                        df.rename(columns={
+                            'Timestamp': 'open_time',
+                            'Open': 'open_price',
+                            'High': 'high_price',
+                            'Low': 'low_price',
+                            'Close': 'close_price',
+                            'Volume': 'volume'
+                        }, inplace=True)
+
+                        # Keep the results in session state, with the selection they were fetched for,
+                        # so widget reruns can redraw them without refetching or re-serializing the
+                        # DataFrame to Arrow
+                        st.session_state["klines_results"] = {
+                            "selection": selection,
+                            "metrics": {
+                                "Open": open_price,
+                                "High": high_price,
+                                "Low": low_price,
+                                "Close": close_price,
+                                "Avg Volume": avg_volume
+                            },
+                            "figure": candle_graph(df, exchange),
+                            "arrow_table": pa.Table.from_pandas(df, preserve_index=False)
                         }
 
-                        for col, (label, value) in zip(st.columns(5), metric_data.items()):
-                            with col:
-                                st.markdown(f"""
-                                    <div class="metric-box">
-                                        <div class="metric-label">{label}</div>
-                                        <div class="metric-value">{value:,.4f}</div>
-                                    </div>""", unsafe_allow_html=True)
-
-                        # Middle Row: Graph and Table Layout
-                        col_left, col_right = st.columns([6, 4])
-
-                        with col_left:
-                            df.rename(columns={
-                                'Timestamp': 'open_time',
-                                'Open': 'open_price',
-                                'High': 'high_price',
-                                'Low': 'low_price',
-                                'Close': 'close_price',
-                                'Volume': 'volume'
-                            }, inplace=True)
-                            candlestick_df = candle_graph(df, exchange)
-                            st.plotly_chart(candlestick_df)
-
-                        with col_right:
-                            st.dataframe(df, use_container_width=True)
-
                 else:
                     st.error(f"Erreur {response.status_code}: {response.text}")
             except requests.exceptions.RequestException as e:
                 st.error(f"Erreur de connexion à l'API: {e}")
 
+    # Render the last fetched klines (kept across reruns), unless the selection changed since
+    results = st.session_state.get("klines_results")
+    if results is not None and results["selection"] == selection:
+        # One HTML block for the five metric boxes (laid out by the .metric-row CSS)
+        metric_boxes = "".join(
+            f'<div class="metric-box"><div class="metric-label">{label}</div>'
+            f'<div class="metric-value">{value:,.4f}</div></div>'
+            for label, value in results["metrics"].items())
+        st.markdown(f'<div class="metric-row">{metric_boxes}</div>', unsafe_allow_html=True)
 
+        # Middle Row: Graph and Table Layout
+        col_left, col_right = st.columns([6, 4])
 
+        with col_left:
+            st.plotly_chart(results["figure"])
 
-
-
-
-
-
-
-
-
+        with col_right:
+            st.dataframe(results["arrow_table"], use_container_width=True)
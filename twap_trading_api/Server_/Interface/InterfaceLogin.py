@@ -1,23 +1,16 @@
 import streamlit as st
 import requests
 import time
-
-API_URL = "http://localhost:8000"
+from ApiClient import API_URL, SESSION
 
 def login_page():
     st.title("Trading Dashboard - Authentication")
 
     # Initialize session state variables
-    if "logged_in" not in st.session_state:
-        st.session_state.logged_in = False
-    if "guest_mode" not in st.session_state:
-        st.session_state.guest_mode = False
-    if "token" not in st.session_state:
-        st.session_state.token = None
-    if "auth_mode" not in st.session_state:
-        st.session_state.auth_mode = "Login"
-    if "websocket_running" not in st.session_state:
-        st.session_state.websocket_running = False  # to control TWAP websockets
+    for key, default in (("logged_in", False), ("guest_mode", False), ("token", None),
+                         ("auth_mode", "Login"),
+                         ("websocket_running", False)):  # websocket_running controls TWAP websockets
+        st.session_state.setdefault(key, default)
 
     # Reset variables when going to the login page
     reset_session_state()
@@ -51,7 +44,7 @@ def reset_session_state():
     """
       Clears variables related to TWAP and active orders.
     """
-    keys_to_clear = ["order_id", "headers", "show_orderbook", "websocket_running"]
+    keys_to_clear = ["order_id", "order_token", "show_orderbook", "websocket_running"]
     for key in keys_to_clear:
         if key in st.session_state:
             del st.session_state[key]
@@ -69,7 +62,7 @@ def show_login_form():
 
     if login_button:
         try:
-            response = requests.post(f"{API_URL}/login", json={"username": username, "password": password})
+            response = SESSION.post(f"{API_URL}/login", json={"username": username, "password": password})
             if response.status_code == 200:
                 st.session_state.logged_in = True
                 st.session_state.guest_mode = False
@@ -102,23 +95,28 @@ def show_signup_form():
             return
 
         try:
-            response = requests.post(
+            response = SESSION.post(
                 f"{API_URL}/register",
                 json={"username": new_username, "password": new_password}
             )
             if response.status_code in [200, 201]:
                 st.success("✅ Registration successful! Logging in...")
 
-                # Auto-login after registration
-                login_response = requests.post(
-                    f"{API_URL}/login",
-                    json={"username": new_username, "password": new_password}
-                )
-
-                if login_response.status_code == 200:
+                # Auto-login after registration: the token is returned by /register,
+                # the /login call is only a fallback
+                token = response.json().get("access_token")
+                if token is None:
+                    login_response = SESSION.post(
+                        f"{API_URL}/login",
+                        json={"username": new_username, "password": new_password}
+                    )
+                    if login_response.status_code == 200:
+                        token = login_response.json()["access_token"]
+
+                if token is not None:
                     st.session_state.logged_in = True
                     st.session_state.guest_mode = False
-                    st.session_state.token = login_response.json()["access_token"]
+                    st.session_state.token = token
                     st.session_state.username = new_username
                     st.success(f"✅ Successfully logged in as {new_username} after registration!")
                     time.sleep(1)
@@ -1,7 +1,7 @@
 import streamlit as st
 import requests
-
-API_URL = "http://localhost:8000"
+from ApiClient import fetch_exchanges, fetch_symbols
+from Navigation import render_sidebar
 
 def symbols_page():
     if not st.session_state.get('logged_in', False) and not st.session_state.get('guest_mode', False):
@@ -9,40 +9,19 @@ def symbols_page():
         st.rerun()
 
     # Sidebar
-    with st.sidebar:
-        st.title("Navigation")
-        if st.session_state.get('guest_mode', False):
-            st.write("👥 Guest Mode")
-        elif st.session_state.get('logged_in', False):
-            st.write(f"✅ Logged in as **{st.session_state.get('username', 'User')}**")
-
-        if st.button("📊 Market Data"):
-            st.session_state.page = 'klines'
-            st.rerun()
-
-        if st.button("🔎 Symbols"):
-            st.session_state.page = 'symbols'
-            st.rerun()
-
-        if st.button("📈 TWAP"):
-            st.session_state.page = 'twap'
-            st.rerun()
-
-        if st.button("🚪 Logout"):
-            st.session_state.logged_in = False
-            st.session_state.guest_mode = False
-            st.session_state.page = 'login'
-            st.rerun()
+    render_sidebar()
 
     # Main content
     st.title("Symbols")
     st.write("Use the dropdown to select an exchange, and search to filter symbols.")
 
     # Fetch exchanges
-    exchanges_response = requests.get(f"{API_URL}/exchanges")
-    if exchanges_response.status_code == 200:
-        exchanges = exchanges_response.json().get("exchanges", [])
+    try:
+        exchanges = fetch_exchanges()
+    except requests.RequestException:
+        exchanges = None
 
+    if exchanges is not None:
         if exchanges:
             with st.container():
                 st.subheader("Select an Exchange")
@@ -53,10 +32,12 @@ def symbols_page():
                 if selected_exchange:
                     st.subheader(f"Available Symbols for **{selected_exchange}**")
 
-                    response = requests.get(f"{API_URL}/{selected_exchange}/symbols")
-                    if response.status_code == 200:
-                        symbols = response.json().get("symbols", [])
+                    try:
+                        symbols = fetch_symbols(selected_exchange)
+                    except requests.RequestException:
+                        symbols = None
 
+                    if symbols is not None:
                         # Display symbol count
                         st.write(f"**Total Symbols:** {len(symbols)}")
 
@@ -70,10 +51,9 @@ def symbols_page():
                             filtered_symbols = symbols
 
                         if filtered_symbols:
-                            # Display filtered symbols in grid format
-                            cols = st.columns(3)
-                            for index, symbol in enumerate(filtered_symbols):
-                                cols[index % 3].write(f"**{symbol}**")
+                            # Display filtered symbols in a single table (one element instead of one per symbol)
+                            st.dataframe({"Symbol": filtered_symbols}, hide_index=True, use_container_width=True,
+                                         column_config={"Symbol": st.column_config.TextColumn("Symbol")})
                         else:
                             st.info("No symbols match your search.")
                     else:
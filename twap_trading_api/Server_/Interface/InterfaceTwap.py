@@ -1,15 +1,239 @@
 from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+import queue
 import requests
-import asyncio
-import websockets
-import json
-import pandas as pd
+from ApiClient import API_URL, SESSION, fetch_exchanges, fetch_symbols, token_expired
+from Navigation import render_sidebar
 
-API_BASE_URL = "http://localhost:8000"
-WEBSOCKET_URL = "ws://localhost:8000/ws"
+# pandas and the WebSocket feed (websockets) are imported lazily, only once the live order book is shown
+
+API_BASE_URL = API_URL
 TWAP_ENDPOINT = f"{API_BASE_URL}/orders/twap"
-EXCHANGES_ENDPOINT = f"{API_BASE_URL}/exchanges"
+
+# Refresh interval (in seconds) of the live order book, matching the coalescing interval of the feed
+REFRESH_INTERVAL = 0.2
+
+# The volumes stay numeric in the DataFrame and are formatted by the front end
+VOLUME_COLUMN = st.column_config.NumberColumn(format="%.6f")
+
+# Layout of the TWAP order summary, filled with the fields of the order status
+TWAP_SUMMARY_TEMPLATE = """| Field | Value |
+|---|---|
+| Order ID | {order_id} |
+| Exchange | {exchange} |
+| Symbol | {symbol} |
+| Status | {status} |
+| Execution Percentage | {percent_exec:.2f} % |
+| Average Execution Price | {avg_exec_price:.2f} |
+| Executed Lots | {lots_count} |
+| Executed Quantity | {total_exec:.2f} |"""
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_trading_pairs_set(exchange: str) -> frozenset:
+    """
+    Trading pairs of an exchange as a frozenset, cached per exchange so that changing
+    the selection only hashes the symbols of the newly selected exchanges.
+    """
+    return frozenset(fetch_symbols(exchange))
+
+
+def fetch_trading_pairs(exchange) -> frozenset:
+    try:
+        return fetch_trading_pairs_set(exchange)
+    except requests.RequestException:
+        st.error(f"Unable to fetch symbols for {exchange}")
+        return frozenset()
+
+
+def prefetch_trading_pairs(exchange: str):
+    """
+    Loads the trading pairs of an exchange in the cache of fetch_trading_pairs_set.
+    Failures are ignored: they are reported by fetch_trading_pairs if the exchange is selected.
+    """
+    try:
+        fetch_trading_pairs_set(exchange)
+    except requests.RequestException:
+        pass
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def prefetch_all_trading_pairs(exchanges: list[str]):
+    """
+    Fetches the trading pairs of all the exchanges in parallel when the page is loaded,
+    so selecting other exchanges afterwards is served from the cache.
+    """
+    if not exchanges:
+        return
+
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(max_workers=len(exchanges), initializer=add_script_run_ctx,
+                            initargs=(None, ctx)) as executor:
+        list(executor.map(prefetch_trading_pairs, exchanges))
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_common_trading_pairs(exchanges: list[str]) -> list[str]:
+    """
+    For each exchange in the list, retrieves its trading pairs and constructs the intersection of all these sets.
+    Returns the list of common symbols, sorted in alphabetical order
+    """
+    if not exchanges:
+        return []
+
+    # Fetch all the exchanges in parallel (worker threads share the script context for st.error)
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(max_workers=len(exchanges), initializer=add_script_run_ctx,
+                            initargs=(None, ctx)) as executor:
+        results = list(executor.map(fetch_trading_pairs, exchanges))
+
+    common_symbols = reduce(frozenset.intersection, results)
+
+    return sorted(common_symbols)
+
+
+def build_order_book_table(update: dict):
+    """
+    Builds the order book DataFrame and its column configuration from the arrays prepared by the feed.
+
+    Returns:
+        tuple: The DataFrame and the column configuration of its volume columns.
+    """
+    import pandas as pd
+
+    order_book_df = pd.DataFrame({
+        "Bid Price": update["bid_prices"],
+        "Bid Volume": update["bid_volumes"],
+        "Bid Exchange": update["bid_sources"],
+        "Ask Price": update["ask_prices"],
+        "Ask Volume": update["ask_volumes"],
+        "Ask Exchange": update["ask_sources"]
+    }, copy=False)  # The arrays are used as they are, without consolidating them into a copy
+
+    return order_book_df, {"Bid Volume": VOLUME_COLUMN, "Ask Volume": VOLUME_COLUMN}
+
+
+def render_order_book(update: dict, symbol: str, container: st.delta_generator.DeltaGenerator):
+    """
+    Displays an order book update received from the WebSocket in the container.
+    The feed publishes a new dict for each snapshot, so the table is only built again
+    when the snapshot changed since the previous refresh.
+    """
+    table = st.session_state.get("order_book_table")
+    if table is None or table[0] is not update:
+        table = (update, *build_order_book_table(update))
+        st.session_state["order_book_table"] = table
+    _, order_book_df, column_config = table
+
+    # Update the Streamlit container. The title is static and the table keeps a stable key
+    # across refreshes, only the caption and the rows change with each snapshot.
+    container.markdown(f"### Order Book – {symbol}")
+    container.caption(f"Last update: {update['timestamp']}")
+    container.dataframe(order_book_df, column_config=column_config, key="orderbook_live")
+
+
+def twap_summary_markdown(order_status: dict) -> str:
+    """
+    Formats the TWAP order summary as a two-column Markdown table.
+
+    Args:
+        order_status (dict): Current state of the order.
+
+    Returns:
+        str: The Markdown table.
+    """
+    return TWAP_SUMMARY_TEMPLATE.format_map(order_status)
+
+
+def render_twap_summary(order_status: dict, container):
+    """
+    Renders the TWAP order summary in the container.
+    The table is only formatted again when a new order status was received.
+
+    Args:
+        order_status (dict): Current state of the order.
+        container: Streamlit container in which the table is rendered.
+    """
+    summary = st.session_state.get("twap_summary")
+    if summary is None or summary[0] is not order_status:
+        summary = (order_status, twap_summary_markdown(order_status))
+        st.session_state["twap_summary"] = summary
+    container.markdown(summary[1])
+
+
+def update_order_table(order_status: dict, table_placeholder) -> bool:
+    """
+    Displays the order status in the placeholder.
+    Returns True once the order is 'completed'.
+    """
+    order_completed = False
+    msg = ""
+
+    if order_status.get("status") == "executing":
+        msg = "### 📊 Executing Order..."
+    elif order_status.get("status") == "completed":
+        msg = "### 📊 Final Order Summary"
+        order_completed = True
+        st.success("✅ Order completed successfully!")
+
+    container = table_placeholder.container()
+    container.markdown(msg)
+    render_twap_summary(order_status, container)
+
+    return order_completed
+
+
+@st.fragment(run_every=REFRESH_INTERVAL)
+def stream_updates(symbol: str, selected_exchanges: List[str]):
+    """
+    Displays the live order book and tracks the order status (if an order was submitted).
+
+    Both are streamed by the background feed. This fragment is rerun on its own every
+    REFRESH_INTERVAL: it renders the latest order book snapshot and drains the pending
+    order status updates, without rerunning the rest of the page.
+    """
+    from OrderBookFeed import get_order_book_feed
+
+    feed = get_order_book_feed()
+    feed.subscribe(symbol, selected_exchanges)
+
+    update = feed.get_latest(symbol, selected_exchanges)
+    if update is not None:
+        render_order_book(update, symbol, st.container())
+    elif feed.error:
+        st.error(feed.error)
+    else:
+        st.info("Waiting for the order book...")
+
+    if "order_id" not in st.session_state:
+        return
+
+    order_id = st.session_state["order_id"]
+    if st.session_state.get("monitored_order_id") != order_id:
+        # The server answers the subscription with the current state of the order
+        st.session_state["monitored_order_id"] = order_id
+        st.session_state["order_updates"] = feed.subscribe_order(order_id, st.session_state["order_token"])
+        st.session_state["order_status"] = None
+
+    # Drain the pending updates, until the order is completed or could not be tracked
+    order_status = st.session_state["order_status"]
+    order_updates = st.session_state["order_updates"]
+    while order_status is None or ("error" not in order_status and order_status.get("status") != "completed"):
+        try:
+            order_status = order_updates.get_nowait()
+        except queue.Empty:
+            break
+    st.session_state["order_status"] = order_status
+
+    if order_status is None:
+        st.info("Waiting for the order status...")
+    elif "error" in order_status:
+        st.error(f"Failed to track the order: {order_status['error']}")
+    else:
+        update_order_table(order_status, st.empty())
 
 
 def twap_page():
@@ -19,180 +243,16 @@ def twap_page():
         st.rerun()
 
     # Sidebar Navigation
-    with st.sidebar:
-        st.title("Navigation")
-        if st.session_state.get('guest_mode', False):
-            st.write("👥 Guest Mode")
-        elif st.session_state.get('logged_in', False):
-            st.write(f"✅ Logged in as **{st.session_state.get('username', 'User')}**")
-
-        if st.button("📊 Market Data"):
-            st.session_state.page = 'klines'
-            st.rerun()
-
-        if st.button("🔎 Symbols"):
-            st.session_state.page = 'symbols'
-            st.rerun()
-
-        if st.button("📈 TWAP"):
-            st.session_state.page = 'twap'
-            st.rerun()
-
-        if st.button("🚪 Logout"):
-            st.session_state.logged_in = False
-            st.session_state.guest_mode = False
-            st.session_state.page = 'login'
-            st.rerun()
+    render_sidebar()
 
     # Fetch exchanges
-    exchanges_response = requests.get(EXCHANGES_ENDPOINT)
-    exchanges = exchanges_response.json().get("exchanges", [])
-
-    @st.cache_data
-    def fetch_trading_pairs(exchange):
-        url = f"{API_BASE_URL}/{exchange}/symbols"
-        response = requests.get(url)
-        if response.status_code == 200:
-            return response.json().get("symbols", [])
-        else:
-            st.error(f"Unable to fetch symbols for {exchange}")
-            return []
-
-    @st.cache_data
-    def fetch_common_trading_pairs(exchanges: list[str]) -> list[str]:
-        """
-        For each exchange in the list, retrieves its trading pairs and constructs the intersection of all these sets.
-        Returns the list of common symbols, sorted in alphabetical order
-        """
-        if not exchanges:
-            return []
-
-        common_symbols = None
-
-        for ex in exchanges:
-            symbols = fetch_trading_pairs(ex)
-            symbols_set = set(symbols)
-
-            if common_symbols is None:
-                common_symbols = symbols_set
-            else:
-                common_symbols.intersection_update(symbols_set)
-
-            if not common_symbols:
-                break
+    try:
+        exchanges = fetch_exchanges()
+    except requests.RequestException:
+        st.error("❌ Error retrieving exchanges. Please check your API connection.")
+        exchanges = []
 
-        return sorted(common_symbols) if common_symbols else []
-
-    async def websocket_listener(symbol: str, exchange: List[str], container: st.delta_generator.DeltaGenerator):
-
-        try:
-            async with websockets.connect(WEBSOCKET_URL) as websocket:
-                # Build the subscription message
-                subscribe_message = {
-                    "action": "subscribe",
-                    "symbol": symbol,
-                    "exchanges": exchange
-                }
-                await websocket.send(json.dumps(subscribe_message))
-
-                # Receive loop
-                while True:
-                    message = await websocket.recv()
-                    data = json.loads(message)
-
-                    if data.get("type") == "order_book_update":
-                        order_book = data["order_book"]
-                        timestamp = data["timestamp"]
-
-                        # Extract bids/asks
-                        bids = order_book.get("bids", {})
-                        asks = order_book.get("asks", {})
-
-                        # Build a DataFrame for display
-                        order_book_df = pd.DataFrame({
-                            "Bid Price": list(bids.keys()),
-                            "Bid Volume": [v[0] for v in bids.values()],
-                            "Bid Exchange": [v[1] for v in bids.values()],
-                            "Ask Price": list(asks.keys()),
-                            "Ask Volume": [v[0] for v in asks.values()],
-                            "Ask Exchange": [v[1] for v in asks.values()]
-                        })
-
-                        # Update the Streamlit container
-                        container.markdown(f"### Order Book – {symbol} ({timestamp})")
-                        container.dataframe(order_book_df)
-
-                    # Small pause to avoid overloading the CPU
-                    await asyncio.sleep(0.5)
-        except websockets.exceptions.ConnectionClosedError as e:
-            container.error(f"WebSocket closed: {e}")
-        except Exception as e:
-            container.error(f"WebSocket error: {e}")
-
-    def display_twap_summary(order_status) -> pd.DataFrame:
-        data = {
-            "Field": [
-                "Order ID",
-                "Exchange",
-                "Symbol",
-                "Status",
-                "Execution Percentage",
-                "Average Execution Price",
-                "Executed Lots",
-                "Executed Quantity",
-            ],
-            "Value": [
-                str(order_status["order_id"]),
-                str(order_status["exchange"]),
-                str(order_status["symbol"]),
-                str(order_status["status"]),
-                f"{order_status['percent_exec']:.2f} %",
-                f"{order_status['avg_exec_price']:.2f}",
-                str(order_status["lots_count"]),
-                f"{order_status['total_exec']:.2f}",
-            ]
-        }
-        return pd.DataFrame(data)
-
-    async def monitor_order_until_completion(order_id: str, headers: dict):
-        """
-        Periodically checks (via HTTP GET) if the order is 'completed'.
-        Displays the final summary if completed.
-        """
-        order_completed = False
-
-        # 1) To store order updates
-        table_placeholder = st.empty()
-        msg = ""
-
-        while not order_completed:
-            try:
-                order_status_endpoint = f"{API_BASE_URL}/orders/?order_id={order_id}"
-                response = requests.get(order_status_endpoint, headers=headers)
-
-                if response.status_code == 200:
-                    order_status = response.json()[0]
-
-                    if order_status.get("status") == "executing":
-                        msg = "### 📊 Executing Order..."
-                    elif order_status.get("status") == "completed":
-                        msg = "### 📊 Final Order Summary"
-                        order_completed = True
-                        st.success("✅ Order completed successfully!")
-
-                    with table_placeholder.container():
-                        st.markdown(msg)
-                        df = display_twap_summary(order_status)
-                        st.table(df.style.hide(axis="index"))
-
-                else:
-                    st.error(f"Failed to retrieve order status: {response.text}")
-                    break
-
-                await asyncio.sleep(1)
-            except Exception as e:
-                st.error(f"Error checking order status: {e}")
-                break
+    prefetch_all_trading_pairs(exchanges)
 
     col_form, col_orderbook = st.columns([1, 2])
 
@@ -213,12 +273,6 @@ def twap_page():
         if st.button("Show Live Order Book"):
             st.session_state["show_orderbook"] = True
 
-        # TWAP order parameters
-        side = st.selectbox("Side", ["buy", "sell"])
-        quantity = st.number_input("Total Quantity", min_value=0.0)
-        limit_price = st.number_input("Limit Price", min_value=0.0)
-        duration = st.number_input("Duration (in seconds)", min_value=1)
-
         # Token
         token = st.session_state.get('token', None)
 
@@ -227,8 +281,24 @@ def twap_page():
             st.session_state.page = 'login'
             st.rerun()
 
-        # Submit TWAP order button
-        if st.button("Submit TWAP Order"):
+        # TWAP order parameters, in a form so that editing them does not rerun the page
+        with st.form("twap_form"):
+            side = st.selectbox("Side", ["buy", "sell"])
+            quantity = st.number_input("Total Quantity", min_value=0.0)
+            limit_price = st.number_input("Limit Price", min_value=0.0)
+            duration = st.number_input("Duration (in seconds)", min_value=1)
+
+            # Submit TWAP order button
+            submitted = st.form_submit_button("Submit TWAP Order")
+
+        if submitted:
+            # An expired token would only be rejected by the API after submitting the order
+            if token_expired(token):
+                st.error("Your session has expired. Please log in again.")
+                st.session_state.logged_in = False
+                st.session_state.page = 'login'
+                st.rerun()
+
             order_data = {
                 "symbol": symbol,
                 "side": side,
@@ -239,45 +309,21 @@ def twap_page():
             }
             headers = {"Authorization": f"Bearer {token}"}
 
-            response = requests.post(TWAP_ENDPOINT, json=order_data, headers=headers)
+            response = SESSION.post(TWAP_ENDPOINT, json=order_data, headers=headers)
             if response.status_code == 200:
                 st.success("TWAP Order submitted successfully.")
                 order_id = response.json()["token_id"]
 
                 # Store in session for tracking
                 st.session_state["order_id"] = order_id
-                st.session_state["headers"] = headers
+                st.session_state["order_token"] = token
             else:
                 st.error(f"Error: {response.json()}")
 
     # Display order book
     with col_orderbook:
-        # Container to display the order book
-        order_book_container = st.empty()
-
         # If user clicked "Show Live Order Book", start real-time subscription
         if st.session_state["show_orderbook"]:
-            # Run the WebSocket + order tracking loop (in parallel)
-            async def main():
-                task_list = []
-
-                # Task 1: Real-time order book
-                task_list.append(asyncio.create_task(
-                    websocket_listener(symbol, selected_exchanges, order_book_container)
-                ))
-
-                # Task 2: If an order was submitted, track its status
-                if "order_id" in st.session_state:
-                    order_id = st.session_state["order_id"]
-                    headers = st.session_state["headers"]
-                    task_list.append(asyncio.create_task(
-                        monitor_order_until_completion(order_id, headers)
-                    ))
-
-                # Run all tasks concurrently
-                await asyncio.gather(*task_list)
-
-            # Run the asyncio loop
-            asyncio.run(main())
+            stream_updates(symbol, selected_exchanges)
         else:
-            order_book_container.info("Click 'Show Live Order Book' to start the live order book feed.")
\ No newline at end of file
+            st.info("Click 'Show Live Order Book' to start the live order book feed.")
\ No newline at end of file
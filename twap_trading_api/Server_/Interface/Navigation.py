@@ -0,0 +1,39 @@
+import streamlit as st
+
+
+def go_to(page: str):
+    """
+    Button callback switching the displayed page.
+    Callbacks run before the rerun triggered by the click, so the target page is rendered
+    directly instead of rendering the current page again and calling st.rerun().
+
+    Args:
+        page (str): Name of the page to display.
+    """
+    st.session_state.page = page
+
+
+def logout():
+    """
+    Logout button callback.
+    """
+    st.session_state.logged_in = False
+    st.session_state.guest_mode = False
+    st.session_state.page = 'login'
+
+
+def render_sidebar():
+    """
+    Displays the navigation sidebar shared by the dashboard pages.
+    """
+    with st.sidebar:
+        st.title("Navigation")
+        if st.session_state.get('guest_mode', False):
+            st.write("👥 Guest Mode")
+        elif st.session_state.get('logged_in', False):
+            st.write(f"✅ Logged in as **{st.session_state.get('username', 'User')}**")
+
+        st.button("📊 Market Data", on_click=go_to, args=('klines',))
+        st.button("🔎 Symbols", on_click=go_to, args=('symbols',))
+        st.button("📈 TWAP", on_click=go_to, args=('twap',))
+        st.button("🚪 Logout", on_click=logout)
@@ -0,0 +1,340 @@
+import asyncio
+import functools
+import queue
+from itertools import islice
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import orjson
+import streamlit as st
+import websockets
+
+WEBSOCKET_URL = "ws://localhost:8000/ws"
+
+# Window (in seconds) during which order book updates are coalesced into a single snapshot
+COALESCE_INTERVAL = 0.2
+
+# Delay (in seconds) before reconnecting when the WebSocket is closed
+RECONNECT_DELAY = 1
+
+# Time (in seconds) after which a symbol whose order book is no longer read is unsubscribed
+IDLE_TIMEOUT = 60
+
+# Number of levels kept on each side of the order book (the server sends them best price first)
+ORDER_BOOK_DEPTH = 10
+
+
+def order_book_key(symbol: str, exchanges) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Key of an order book in the feed: the same symbol aggregated from different exchanges
+    is a different order book.
+    """
+    return symbol, tuple(sorted(exchanges))
+
+
+@functools.lru_cache(maxsize=128)
+def _subscribe_payload(symbol: str, exchanges: Tuple[str, ...]) -> str:
+    """
+    Serialized subscription message of a symbol, built once and reused on every (re)connection.
+    """
+    return orjson.dumps({"action": "subscribe", "symbol": symbol, "exchanges": list(exchanges)}).decode()
+
+
+def _unsubscribe_payload(symbol: str, exchanges: Tuple[str, ...]) -> str:
+    """
+    Serialized unsubscription message of a symbol.
+    """
+    return orjson.dumps({"action": "unsubscribe", "symbol": symbol, "exchanges": list(exchanges)}).decode()
+
+
+def split_order_book_side(levels: dict, depth: int = ORDER_BOOK_DEPTH):
+    """
+    Splits the best levels of one side of the order book ({price: [volume, exchange]}) into
+    a price array, a volume array and the list of source exchanges.
+    Only the first depth levels are read, however deep the received book is.
+    """
+    count = min(len(levels), depth)
+    values = list(islice(levels.values(), count))
+    prices = np.fromiter(islice(levels.keys(), count), dtype=np.float64, count=count)
+    volumes = np.fromiter((v[0] for v in values), dtype=np.float64, count=count)
+    sources = [v[1] for v in values]
+    return prices, volumes, sources
+
+
+def add_order_book_arrays(update: dict):
+    """
+    Adds the bids and asks of an "order_book_update" message as parallel arrays
+    (bid_prices, bid_volumes, bid_sources, ask_prices, ask_volumes, ask_sources).
+    The raw "order_book" is kept as received.
+    """
+    order_book = update["order_book"]
+    for side in ("bid", "ask"):
+        prices, volumes, sources = split_order_book_side(order_book.get(f"{side}s", {}))
+        update[f"{side}_prices"] = prices
+        update[f"{side}_volumes"] = volumes
+        update[f"{side}_sources"] = sources
+
+
+class OrderBookFeed:
+    """
+    Streams the order book and order status updates of the API WebSocket in a background thread.
+
+    The thread runs its own asyncio event loop and keeps a single persistent WebSocket
+    connection, subscribed to every symbol and order requested so far. The latest order book of
+    each symbol and set of exchanges is kept in memory, and the status updates of each order are fanned out to a
+    queue, so Streamlit reruns only read them instead of reconnecting.
+
+    Symbols whose order book is no longer read (e.g. their sessions were closed) are unsubscribed
+    after IDLE_TIMEOUT seconds, so the server stops streaming them.
+    """
+
+    def __init__(self, websocket_url: str = WEBSOCKET_URL):
+        """
+        Initialize the feed and start its event loop in a daemon thread.
+
+        Args:
+            websocket_url (str): URI of the API WebSocket endpoint.
+        """
+        self.websocket_url = websocket_url
+        self.lock = threading.Lock()
+        # Order books are keyed by (symbol, sorted exchanges), see order_book_key
+        self.subscriptions: Set[Tuple[str, Tuple[str, ...]]] = set()
+        # Only replaced as a whole by the feed thread (never mutated), so it is read without the lock
+        self.latest: Dict[Tuple[str, Tuple[str, ...]], dict] = {}
+        self.order_queues: Dict[str, queue.Queue] = {}
+        # JWT token each order is subscribed with (the server checks that it owns the order)
+        self.order_tokens: Dict[str, str] = {}
+        self.last_read: Dict[Tuple[str, Tuple[str, ...]], float] = {}
+        self.error: Optional[str] = None
+        self.websocket = None
+
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self._run(), self.loop)
+        asyncio.run_coroutine_threadsafe(self._release_idle_subscriptions(), self.loop)
+
+    def subscribe(self, symbol: str, exchanges: List[str]):
+        """
+        Subscribes the feed to the order book of a symbol on the given exchanges
+        (no-op if already subscribed).
+
+        Args:
+            symbol (str): Trading pair symbol (e.g., "BTCUSDT").
+            exchanges (List[str]): Exchanges to aggregate the order book from.
+        """
+        key = order_book_key(symbol, exchanges)
+        with self.lock:
+            self.last_read[key] = time.monotonic()
+            if key in self.subscriptions:
+                return
+            self.subscriptions.add(key)
+
+        asyncio.run_coroutine_threadsafe(self._send_subscribe(*key), self.loop)
+
+    def subscribe_order(self, order_id: str, token: str) -> queue.Queue:
+        """
+        Subscribes the feed to the status updates of a TWAP order.
+
+        Args:
+            order_id (str): Identifier of the TWAP order.
+            token (str): JWT token of the user who submitted the order.
+
+        The server answers each subscription, including the ones sent again after a reconnection,
+        with the current state of the order, so the updates pushed while disconnected are caught up.
+
+        Returns:
+            queue.Queue: Queue receiving the current "order_status" of the order, then the one of each
+                update pushed by the server, or {"error": ...} if the subscription was refused.
+        """
+        with self.lock:
+            if order_id in self.order_queues:
+                return self.order_queues[order_id]
+            self.order_queues[order_id] = order_queue = queue.Queue()
+            self.order_tokens[order_id] = token
+
+        asyncio.run_coroutine_threadsafe(self._send_subscribe_order(order_id, token), self.loop)
+        return order_queue
+
+    def release_order(self, order_id: str):
+        """
+        Unsubscribes from an order that is no longer tracked and releases its status queue.
+        The queue is otherwise released on the "completed" update.
+
+        Args:
+            order_id (str): Identifier of the TWAP order.
+        """
+        with self.lock:
+            self.order_queues.pop(order_id, None)
+            self.order_tokens.pop(order_id, None)
+
+        asyncio.run_coroutine_threadsafe(self._send_unsubscribe_order(order_id), self.loop)
+
+    def get_latest(self, symbol: str, exchanges: List[str]) -> Optional[dict]:
+        """
+        Returns the latest order book update received for a symbol on the given exchanges.
+
+        Args:
+            symbol (str): Trading pair symbol (e.g., "BTCUSDT").
+            exchanges (List[str]): Exchanges the order book is aggregated from.
+
+        Returns:
+            Optional[dict]: The last "order_book_update" message, with its bids and asks as arrays
+                (see add_order_book_arrays), or None if nothing was received yet.
+        """
+        key = order_book_key(symbol, exchanges)
+        self.last_read[key] = time.monotonic()
+        return self.latest.get(key)
+
+    async def _send_subscribe(self, symbol: str, exchanges: Tuple[str, ...]):
+        """
+        Sends the subscription message on the current connection, if any.
+        When not connected, the subscription is sent on (re)connection.
+        """
+        if self.websocket is not None:
+            await self.websocket.send(_subscribe_payload(symbol, exchanges))
+
+    async def _send_subscribe_order(self, order_id: str, token: str):
+        """
+        Sends the order subscription message on the current connection, if any.
+        """
+        if self.websocket is not None:
+            await self.websocket.send(orjson.dumps({"action": "subscribe_order", "order_id": order_id,
+                                                    "token": token}).decode())
+
+    async def _send_unsubscribe_order(self, order_id: str):
+        """
+        Sends the order unsubscription message on the current connection, if any.
+        When not connected, nothing to do: the subscriptions are dropped with the connection.
+        """
+        if self.websocket is not None:
+            await self.websocket.send(orjson.dumps({"action": "unsubscribe_order", "order_id": order_id}).decode())
+
+    async def _release_idle_subscriptions(self):
+        """
+        Periodically unsubscribes from the order books that were not read for IDLE_TIMEOUT seconds.
+        They are subscribed again by the next subscribe() call.
+        """
+        while True:
+            await asyncio.sleep(IDLE_TIMEOUT)
+
+            idle_since = time.monotonic() - IDLE_TIMEOUT
+            with self.lock:
+                idle = {key for key in self.subscriptions if self.last_read.get(key, 0) < idle_since}
+                for key in idle:
+                    self.subscriptions.discard(key)
+                    self.last_read.pop(key, None)
+
+            if not idle:
+                continue
+
+            self.latest = {key: update for key, update in self.latest.items() if key not in idle}
+            # When not connected, nothing to do: the subscriptions are dropped with the connection
+            try:
+                if self.websocket is not None:
+                    for symbol, exchanges in idle:
+                        await self.websocket.send(_unsubscribe_payload(symbol, exchanges))
+            except websockets.ConnectionClosed:
+                pass
+
+    async def _run(self):
+        """
+        Keeps the WebSocket connected and stores the latest order book of each subscription.
+        """
+        while True:
+            try:
+                # Compression is disabled: the order book frames are small and decompressing each
+                # of them costs more than it saves. A short queue bounds the buffered snapshots.
+                async with websockets.connect(self.websocket_url, compression=None, max_queue=8,
+                                              ping_interval=20, ping_timeout=10) as websocket:
+                    self.websocket = websocket
+                    self.error = None
+
+                    with self.lock:
+                        subscriptions = list(self.subscriptions)
+                        order_tokens = list(self.order_tokens.items())
+                    for symbol, exchanges in subscriptions:
+                        await self._send_subscribe(symbol, exchanges)
+                    for order_id, token in order_tokens:
+                        await self._send_subscribe_order(order_id, token)
+
+                    await self._receive(websocket)
+            except Exception as e:
+                self.error = f"WebSocket error: {e}"
+            finally:
+                self.websocket = None
+
+            await asyncio.sleep(RECONNECT_DELAY)
+
+    async def _receive(self, websocket):
+        """
+        Receive loop: drains the messages arriving within the coalescing interval
+        and only publishes the latest order book of each symbol and set of exchanges.
+        Order status updates are not coalesced and are forwarded to their queue as they arrive.
+        """
+        while True:
+            latest_updates = {}
+            message = await websocket.recv()
+
+            deadline = self.loop.time() + COALESCE_INTERVAL
+            while True:
+                data = orjson.loads(message)
+
+                if data.get("type") == "order_book_update":
+                    latest_updates[order_book_key(data["symbol"], data["exchanges"])] = data
+                elif data.get("type") in ("order_status_update", "subscribe_order_success"):
+                    self._publish_order_status(data)
+                elif data.get("type") == "subscribe_order_failure":
+                    self._publish_order_failure(data)
+
+                try:
+                    message = await asyncio.wait_for(websocket.recv(),
+                                                     timeout=max(deadline - self.loop.time(), 0))
+                except asyncio.TimeoutError:
+                    break
+
+            if latest_updates:
+                # Converted once per published snapshot, and shared by every render
+                for update in latest_updates.values():
+                    add_order_book_arrays(update)
+
+                # Copy-on-write publish: rebinding the attribute is atomic, readers never see a partial update
+                self.latest = {**self.latest, **latest_updates}
+
+    def _publish_order_status(self, data: dict):
+        """
+        Forwards an order status (update or current state) to the queue of its order.
+        The queue is released once the order is completed, as the server stops pushing its updates.
+        """
+        order_status = data["order_status"]
+        with self.lock:
+            if order_status.get("status") == "completed":
+                order_queue = self.order_queues.pop(data["order_id"], None)
+                self.order_tokens.pop(data["order_id"], None)
+            else:
+                order_queue = self.order_queues.get(data["order_id"])
+
+        if order_queue is not None:
+            order_queue.put(order_status)
+
+    def _publish_order_failure(self, data: dict):
+        """
+        Forwards a refused order subscription (e.g. expired token) to the queue of its order,
+        and releases the queue.
+        """
+        with self.lock:
+            order_queue = self.order_queues.pop(data["order_id"], None)
+            self.order_tokens.pop(data["order_id"], None)
+
+        if order_queue is not None:
+            order_queue.put({"error": data["error"]})
+
+
+@st.cache_resource
+def get_order_book_feed() -> OrderBookFeed:
+    """
+    Returns the WebSocket feed shared by all the Streamlit sessions.
+    """
+    return OrderBookFeed()
@@ -1,4 +1,8 @@
 import streamlit as st
+from InterfaceLogin import login_page
+from InterfaceKlines import klines_page
+from InterfaceSymbol import symbols_page
+from InterfaceTwap import twap_page
 
 def main():
     # Page Configuration
@@ -9,17 +13,9 @@ def main():
     )
 
     # Session state variables initialization
-    if 'page' not in st.session_state:
-        st.session_state.page = 'login'
-
-    if 'logged_in' not in st.session_state:
-        st.session_state.logged_in = False
-
-    if 'guest_mode' not in st.session_state:
-        st.session_state.guest_mode = False
-
-    if 'websocket_running' not in st.session_state:
-        st.session_state.websocket_running = False
+    for key, default in (('page', 'login'), ('logged_in', False), ('guest_mode', False),
+                         ('websocket_running', False)):
+        st.session_state.setdefault(key, default)
 
     # Security: When changing pages, stop processes (like websocket or TWAP order tracking)
     if st.session_state.page != 'twap':
@@ -30,16 +26,12 @@ def main():
 
     # Router
     if st.session_state.page == 'login':
-        from InterfaceLogin import login_page
         login_page()
     elif st.session_state.page == 'klines':
-        from InterfaceKlines import klines_page
         klines_page()
     elif st.session_state.page == 'symbols':
-        from InterfaceSymbol import symbols_page
         symbols_page()
     elif st.session_state.page == 'twap':
-        from InterfaceTwap import twap_page
         twap_page()
 
 if __name__ == "__main__":
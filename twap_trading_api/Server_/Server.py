@@ -1,16 +1,33 @@
 from fastapi import FastAPI, WebSocketDisconnect, BackgroundTasks
 from starlette.websockets import WebSocket
-from typing import Set, Optional
+from typing import Dict, FrozenSet, Set, Tuple
 import asyncio
 import json
+import orjson
 from contextlib import asynccontextmanager
 
 from twap_trading_api.Server_.Exchanges.ExchangeMulti import ExchangeMulti
 from twap_trading_api.Server_.Exchanges import EXCHANGE_MAPPING
+from twap_trading_api.Server_.Exchanges.ExchangeBase import ExchangeBase
 from twap_trading_api.Server_.DatabaseManager.Database import *
 from twap_trading_api.Server_.Authentification.AuthentificationManager import *
 from twap_trading_api.Server_.TwapOrder import TwapOrder
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Ensures cleanup of running tasks when the application shuts down.
+    """
+    yield
+
+    # Cleanup all background tasks on shutdown
+    for task in manager.broadcast_tasks.values():
+        task.cancel()
+
+    # Close the HTTP session shared by the exchanges
+    await ExchangeBase.close_http_session()
+
+
 """
 Main FastAPI application initialization
 """
@@ -28,7 +45,8 @@ app = FastAPI(
         {"name": "Market Data", "description": "Retrieve historical and real-time market data."},
         {"name": "Authentication", "description": "Endpoints for user login, registration, and security."},
         {"name": "Orders", "description": "Manage TWAP orders, including submission, execution, and tracking."},
-    ]
+    ],
+    lifespan=lifespan
 )
 
 
@@ -126,7 +144,7 @@ async def get_symbols(exchange: str):
     """
     if exchange not in EXCHANGE_MAPPING:
         raise HTTPException(status_code=404, detail="Exchange not available")
-    return {"symbols": list(EXCHANGE_MAPPING[exchange].get_trading_pairs().keys())}
+    return {"symbols": list(await EXCHANGE_MAPPING[exchange].cached_trading_pairs())}
 
 
 # =================================================================================
@@ -168,8 +186,7 @@ async def get_historical_data(exchange: str, symbol: str, interval: str, start_t
         raise HTTPException(status_code=404, detail="Exchange not available")
 
     exchange_object = EXCHANGE_MAPPING[exchange]
-    available_symbols = list(exchange_object.get_trading_pairs().keys())
-    if symbol not in available_symbols:
+    if symbol not in await exchange_object.cached_symbols():
         raise HTTPException(status_code=404, detail="Trading pair not available on this exchange")
 
     start_time_dt = datetime.fromisoformat(start_time)
@@ -190,8 +207,15 @@ class ConnectionManager:
 
     def __init__(self):
         self.active_connections: Set[WebSocket] = set()
-        self.subscriptions: Dict[WebSocket, Set[str]] = {}
-        self.broadcast_tasks: Optional[asyncio.Task] = {}
+        # Order books are broadcast per (symbol, exchanges) pair: the same symbol can be
+        # aggregated from different exchanges for different subscribers
+        self.subscriptions: Dict[WebSocket, Set[Tuple[str, FrozenSet[str]]]] = {}
+        self.broadcast_tasks: Dict[Tuple[str, FrozenSet[str]], asyncio.Task] = {}
+        self.order_subscriptions: Dict[str, Set[WebSocket]] = {}
+        # Pending order status broadcasts, referenced until done so they are not garbage collected
+        self.order_status_tasks: Set[asyncio.Task] = set()
+        # Last order book update sent for each broadcast, replayed to new subscribers
+        self.last_order_book_messages: Dict[Tuple[str, FrozenSet[str]], str] = {}
 
     async def connect(self, websocket: WebSocket):
         """
@@ -210,21 +234,28 @@ class ConnectionManager:
         Disconnects a WebSocket and cancels any broadcast tasks if no other clients are subscribed.
         """
         self.active_connections.discard(websocket)
+        for order_id in list(self.order_subscriptions):
+            self.order_subscriptions[order_id].discard(websocket)
+            if not self.order_subscriptions[order_id]:
+                del self.order_subscriptions[order_id]
+
         if websocket in self.subscriptions:
-            symbols = self.subscriptions[websocket]
+            keys = self.subscriptions[websocket]
             del self.subscriptions[websocket]
 
             # Check if any symbols should stop broadcasting
-            for symbol in symbols:
-                if not any(symbol in subs for subs in self.subscriptions.values()):
-                    if symbol in self.broadcast_tasks:
-                        print(f"🛑 Stopping broadcast for {symbol} (no active subscribers)")
-                        self.broadcast_tasks[symbol].cancel()
-                        del self.broadcast_tasks[symbol]
+            for key in keys:
+                if not any(key in subs for subs in self.subscriptions.values()):
+                    if key in self.broadcast_tasks:
+                        print(f"🛑 Stopping broadcast for {key[0]} (no active subscribers)")
+                        self.broadcast_tasks[key].cancel()
+                        del self.broadcast_tasks[key]
 
     async def handle_websocket(self, websocket: WebSocket):
         """
         Handles WebSocket messages for subscribing/unsubscribing to symbols and manages real-time order book updates.
+        Clients can also subscribe to one of their TWAP orders (with their JWT token) to receive
+        its current state, then its status updates.
         """
 
         await self.connect(websocket)
@@ -235,21 +266,79 @@ class ConnectionManager:
                 data = json.loads(message)
 
                 action = data.get("action")
+
+                if action == "subscribe_order":
+                    order_id = data.get("order_id")
+                    if not order_id:
+                        await websocket.send_text(json.dumps({"error": "Missing order_id"}))
+                        continue
+
+                    # Only the owner of the order can follow it (like GET /orders)
+                    try:
+                        username = get_token_username(data.get("token", ""))
+                        user = database_api.retrieve_user_by_username(username)
+                        if not user:
+                            raise HTTPException(status_code=403, detail="Not authorized")
+                        order_status = database_api.get_orders(user.id, order_id)[0]
+                    except HTTPException as e:
+                        await websocket.send_text(json.dumps({
+                            "type": "subscribe_order_failure",
+                            "error": e.detail,
+                            "order_id": order_id
+                        }))
+                        continue
+
+                    # The current state is sent back, so no update is missed between the order
+                    # submission (or a reconnection) and the subscription. A completed order
+                    # will not be updated anymore: it is not subscribed to.
+                    if order_status["status"] != "completed":
+                        self.order_subscriptions.setdefault(order_id, set()).add(websocket)
+                    await websocket.send_text(orjson.dumps({
+                        "type": "subscribe_order_success",
+                        "message": f"Subscribed to order {order_id}",
+                        "order_id": order_id,
+                        "order_status": order_status
+                    }).decode())
+                    continue
+
+                if action == "unsubscribe_order":
+                    order_id = data.get("order_id")
+                    subscribers = self.order_subscriptions.get(order_id, set())
+                    if websocket in subscribers:
+                        subscribers.discard(websocket)
+                        if not subscribers:
+                            del self.order_subscriptions[order_id]
+                        await websocket.send_text(json.dumps({
+                            "type": "unsubscribe_order_success",
+                            "message": f"Unsubscribed from order {order_id}",
+                            "order_id": order_id
+                        }))
+                    else:
+                        await websocket.send_text(json.dumps({
+                            "type": "unsubscribe_order_failure",
+                            "error": f"Cannot unsubscribe from order {order_id}: Not subscribed.",
+                            "order_id": order_id
+                        }))
+                    continue
+
                 symbol = data.get("symbol")
-                exchanges = set(data.get("exchanges", []))
+                exchanges = frozenset(data.get("exchanges", []))
 
                 if not symbol or not exchanges:
                     await websocket.send_text(json.dumps({"error": "Missing symbol or exchanges"}))
                     continue
 
+                key = (symbol, exchanges)
+
                 if action == "subscribe":
-                    if symbol not in self.subscriptions[websocket]:
+                    if key not in self.subscriptions[websocket]:
                         print(f"➕ Subscribing to {symbol}")
-                        self.subscriptions[websocket].add(symbol)
+                        self.subscriptions[websocket].add(key)
 
-                        # Start broadcasting if not already running
-                        if symbol not in self.broadcast_tasks:
-                            self.broadcast_tasks[symbol] = asyncio.create_task(
+                        # Start broadcasting if not already running (the broadcast ends when
+                        # the order book streams of all its exchanges ended)
+                        if key not in self.broadcast_tasks or self.broadcast_tasks[key].done():
+                            self.broadcast_tasks[key] = asyncio.create_task(
                                 self.broadcast_order_book(symbol, exchanges))
 
                         await websocket.send_text(json.dumps({
@@ -258,6 +347,10 @@ class ConnectionManager:
                             "symbol": symbol,
                             "exchanges": list(exchanges)
                         }))
+
+                        # Unchanged books are not broadcast again: send the current one right away
+                        if key in self.last_order_book_messages:
+                            await websocket.send_text(self.last_order_book_messages[key])
                     else:
                         await websocket.send_text(json.dumps({
                             "type": "subscribe_failure",
@@ -266,15 +359,15 @@ class ConnectionManager:
                         }))
 
                 elif action == "unsubscribe":
-                    if symbol in self.subscriptions[websocket]:
+                    if key in self.subscriptions[websocket]:
                         print(f"➖ Unsubscribing from {symbol}")
-                        self.subscriptions[websocket].remove(symbol)
+                        self.subscriptions[websocket].remove(key)
 
                         # If no one else is subscribed, stop broadcasting
-                        if not any(symbol in subs for subs in self.subscriptions.values()):
-                            if symbol in self.broadcast_tasks:
-                                self.broadcast_tasks[symbol].cancel()
-                                del self.broadcast_tasks[symbol]
+                        if not any(key in subs for subs in self.subscriptions.values()):
+                            if key in self.broadcast_tasks:
+                                self.broadcast_tasks[key].cancel()
+                                del self.broadcast_tasks[key]
 
                         # Send confirmation only if successfully unsubscribed
                         await websocket.send_text(json.dumps({
@@ -293,31 +386,70 @@ class ConnectionManager:
         except WebSocketDisconnect:
             self.disconnect(websocket)
 
-    async def broadcast_order_book(self, symbol: str, exchanges: Set[str]):
+    async def broadcast_order_book(self, symbol: str, exchanges: FrozenSet[str]):
         """
         Periodically fetches aggregated order book data from multiple exchanges
-        and sends it to all clients subscribed to the given symbol.
+        and sends it to all clients subscribed to the given symbol on these exchanges.
+        Unchanged order books are not sent again.
         """
         print(f"🌍 Started broadcasting {symbol} from {exchanges}")
         exchange_objects = [EXCHANGE_MAPPING[exchange] for exchange in exchanges]
         multi_exchange = ExchangeMulti(exchange_objects)
 
-        async for aggregated_order_book in multi_exchange.aggregate_order_books(symbol, display=False):
-            print(f"📩 Sending order book update for {symbol}")
-            message = json.dumps({
-                "type": "order_book_update",
-                "symbol": symbol,
-                "exchanges": list(exchanges),
-                "order_book": aggregated_order_book,
-                "timestamp": datetime.now().isoformat()
-            })
-
-            for websocket, subscriptions in self.subscriptions.items():
-                if symbol in subscriptions:
-                    try:
-                        await websocket.send_text(message)
-                    except:
-                        pass
+        key = (symbol, exchanges)
+        self.last_order_book_messages.pop(key, None)
+        last_order_book = None
+        message = None
+        try:
+            async for aggregated_order_book in multi_exchange.aggregate_order_books(symbol, display=False):
+                # Only send the book when its best levels changed since the previous update
+                if aggregated_order_book == last_order_book:
+                    continue
+                last_order_book = aggregated_order_book
+
+                print(f"📩 Sending order book update for {symbol}")
+                # Prices (the order book keys) are floats, serialized as strings like json.dumps does
+                message = orjson.dumps({
+                    "type": "order_book_update",
+                    "symbol": symbol,
+                    "exchanges": list(exchanges),
+                    "order_book": aggregated_order_book,
+                    "timestamp": datetime.now().isoformat()
+                }, option=orjson.OPT_NON_STR_KEYS).decode()
+                self.last_order_book_messages[key] = message
+
+                for websocket, subscriptions in self.subscriptions.items():
+                    if key in subscriptions:
+                        try:
+                            await websocket.send_text(message)
+                        except:
+                            pass
+        finally:
+            # Cancelled when the last subscriber leaves: drop the cached book so it is not replayed
+            # later, unless a new broadcast of the same book already replaced it
+            if self.last_order_book_messages.get(key) is message:
+                self.last_order_book_messages.pop(key, None)
+
+    async def broadcast_order_status(self, order_id: str, order_status: Dict):
+        """
+        Pushes the new state of a TWAP order to all clients subscribed to it.
+        Subscriptions are dropped once the order is completed.
+        """
+        message = orjson.dumps({
+            "type": "order_status_update",
+            "order_id": order_id,
+            "order_status": order_status,
+            "timestamp": datetime.now().isoformat()
+        }).decode()
+
+        for websocket in list(self.order_subscriptions.get(order_id, ())):
+            try:
+                await websocket.send_text(message)
+            except:
+                pass
+
+        if order_status["status"] == "completed":
+            self.order_subscriptions.pop(order_id, None)
 
 
 # Instantiate the global ConnectionManager to handle WebSocket connections
@@ -335,18 +467,6 @@ async def websocket_endpoint(websocket: WebSocket):
     await manager.handle_websocket(websocket)
 
 
-@asynccontextmanager
-async def lifespan():
-    """
-    Ensures cleanup of running tasks when the application shuts down.
-    """
-    yield
-
-    # Cleanup all background tasks on shutdown
-    for task in manager.broadcast_tasks.values():
-        task.cancel()
-
-
 # =================================================================================
 #                           AUTHENTICATION ENDPOINTS
 # =================================================================================
@@ -418,7 +538,8 @@ async def secure_endpoint(username: str = Depends(verify_token)):
               201: {
                   "description": "User created successfully",
                   "content": {"application/json": {"example": {
-                      "message": "User correctly registered"
+                      "message": "User correctly registered",
+                      "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9..."
                   }}}
               },
               400: {"description": "Username already exists"},
@@ -428,13 +549,14 @@ async def secure_endpoint(username: str = Depends(verify_token)):
 async def register(request: RegisterRequest):
     """
     Creates a new user in the database if the username is not already taken.
+    The JWT token of the new user is returned so that the client can log in without a second request.
     """
     user = database_api.retrieve_user_by_username(request.username)
     if user:
         raise HTTPException(status_code=400, detail="Username already exists")
 
     database_api.create_user(request.username, request.password)
-    return {"message": "User correctly registered"}
+    return {"message": "User correctly registered", "access_token": create_token(request.username)}
 
 
 @app.delete("/unregister",
@@ -512,7 +634,8 @@ def update_order_state(twap):
     """
     Calculates the total executed quantity, the percentage of execution,
     the average execution price, and the number of lots executed.
-    Then, updates this information in the database.
+    Then, updates this information in the database and pushes it to the
+    WebSocket clients subscribed to the order.
 
     Args:
         twap: The TWAP order object to update.
@@ -533,6 +656,17 @@ def update_order_state(twap):
     except Exception as e:
         print("Error updating order state in the database:", e)
 
+    if twap.token_id in manager.order_subscriptions:
+        order_status = {
+            "order_id": twap.token_id,
+            "exchange": ", ".join(twap.exchanges),
+            "symbol": twap.symbol,
+            **state
+        }
+        task = asyncio.create_task(manager.broadcast_order_status(twap.token_id, order_status))
+        manager.order_status_tasks.add(task)
+        task.add_done_callback(manager.order_status_tasks.discard)
+
 
 @app.post("/orders/twap",
           tags=["Orders"],
@@ -7,6 +7,9 @@ from twap_trading_api.Server_.DatabaseManager.Database import database_api
 from twap_trading_api.Server_.Exchanges.ExchangeMulti import ExchangeMulti
 from twap_trading_api.Server_.Exchanges import EXCHANGE_MAPPING
 
+# Time (in seconds) a slice waits for the aggregated order book before reopening the exchange streams
+ORDER_BOOK_TIMEOUT = 10
+
 
 class TwapOrder:
     """
@@ -47,21 +50,43 @@ class TwapOrder:
         self.executions: List[Dict] = []  # Partial executions
         self.status: str = "pending"
         self.avg_execution_price: float = 0.0
+        self.order_book_stream = None  # Aggregated order book stream, open while the order runs
 
     async def get_current_order_book(self) -> Dict:
         """
         Retrieves the aggregated order book from multiple exchanges.
 
+        The exchange streams are opened on the first call and kept open until the order
+        completes, so each slice reads the latest book instead of reconnecting to every exchange.
+        The exchange streams do not reconnect on their own: when the aggregated stream ended or
+        sent nothing for ORDER_BOOK_TIMEOUT seconds, it is opened again. If the new stream fails
+        too, the slice gets an empty order book (nothing is executed).
+
         Returns:
             Dict: The aggregated order book with bids and asks.
         """
         exchange_objects = [EXCHANGE_MAPPING[ex] for ex in self.exchanges if ex in EXCHANGE_MAPPING]
         if not exchange_objects:
             return {"bids": {}, "asks": {}}
-        multi_exchange = ExchangeMulti(exchange_objects)
-        gen = multi_exchange.aggregate_order_books(self.symbol, display=False)
-        aggregated_order_book = await gen.__anext__()
-        return aggregated_order_book
+
+        for _ in range(2):
+            if self.order_book_stream is None:
+                multi_exchange = ExchangeMulti(exchange_objects)
+                self.order_book_stream = multi_exchange.aggregate_order_books(self.symbol, display=False)
+            try:
+                return await asyncio.wait_for(self.order_book_stream.__anext__(), timeout=ORDER_BOOK_TIMEOUT)
+            except (StopAsyncIteration, asyncio.TimeoutError):
+                await self.close_order_book_stream()
+
+        return {"bids": {}, "asks": {}}
+
+    async def close_order_book_stream(self):
+        """
+        Closes the aggregated order book stream (and its exchange connections), if open.
+        """
+        if self.order_book_stream is not None:
+            await self.order_book_stream.aclose()
+            self.order_book_stream = None
 
     def check_execution(self, order_book: Dict, slice_quantity: float) -> List[Dict]:
         """
@@ -119,29 +144,32 @@ class TwapOrder:
         slices = self.duration_seconds
         slice_quantity = self.total_quantity / slices
 
-        for _ in range(slices):
-            await asyncio.sleep(1)
-            order_book = await self.get_current_order_book()
-            sub_orders = self.check_execution(order_book, slice_quantity)
-            if sub_orders:
-                for sub in sub_orders:
-                    execution = {
-                        "timestamp": datetime.now().isoformat(),
-                        "side": self.side,
-                        "quantity": sub["quantity"],
-                        "price": sub["price"],
-                        "exchange": sub["exchange"]
-                    }
-                    self.executions.append(execution)
-                    database_api.add_order_executions(self.token_id, self.symbol, execution["side"],
-                                                      execution["quantity"], execution["price"], execution["exchange"],
-                                                      execution["timestamp"])
-                    total_executed += sub["quantity"]
-                    total_cost += sub["price"] * sub["quantity"]
-            self.status = "executing"
-            self.avg_execution_price = total_cost / total_executed if total_executed > 0 else 0
-            if update_callback:
-                update_callback(self)
+        try:
+            for _ in range(slices):
+                await asyncio.sleep(1)
+                order_book = await self.get_current_order_book()
+                sub_orders = self.check_execution(order_book, slice_quantity)
+                if sub_orders:
+                    for sub in sub_orders:
+                        execution = {
+                            "timestamp": datetime.now().isoformat(),
+                            "side": self.side,
+                            "quantity": sub["quantity"],
+                            "price": sub["price"],
+                            "exchange": sub["exchange"]
+                        }
+                        self.executions.append(execution)
+                        database_api.add_order_executions(self.token_id, self.symbol, execution["side"],
+                                                          execution["quantity"], execution["price"],
+                                                          execution["exchange"], execution["timestamp"])
+                        total_executed += sub["quantity"]
+                        total_cost += sub["price"] * sub["quantity"]
+                self.status = "executing"
+                self.avg_execution_price = total_cost / total_executed if total_executed > 0 else 0
+                if update_callback:
+                    update_callback(self)
+        finally:
+            await self.close_order_book_stream()
 
         self.status = "completed"
         database_api.update_order_status(self.token_id, self.status)